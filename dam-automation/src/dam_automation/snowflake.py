@@ -1,7 +1,9 @@
 """Snowflake provisioning helpers for external volumes and catalog integrations."""
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Generator, Iterable, Optional
@@ -38,6 +40,13 @@ class SnowflakeDropSummary:
     database_dropped: bool
 
 
+@functools.lru_cache(maxsize=32)
+def _sensitive_pattern(values: tuple[str, ...]) -> re.Pattern[str]:
+    # Longest first so a secret that prefixes another cannot leave a partial match behind.
+    ordered = sorted(values, key=len, reverse=True)
+    return re.compile("|".join(re.escape(value) for value in ordered))
+
+
 class SnowflakeAuthorizationError(RuntimeError):
     """Raised when Snowflake cannot authenticate against the Polaris REST endpoint."""
 
@@ -370,8 +379,8 @@ class SnowflakeProvisioner:
 
     @staticmethod
     def _log_ddl(ddl: str, sensitive_values: Iterable[str]) -> None:
-        sanitized = ddl
-        for value in sensitive_values:
-            if value:
-                sanitized = sanitized.replace(value, "***")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        secrets = tuple(value for value in sensitive_values if value)
+        sanitized = _sensitive_pattern(secrets).sub("***", ddl) if secrets else ddl
         logger.debug("Executing Snowflake SQL:\n%s", sanitized)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def dummy_config_path(tmp_path_factory) -> Path:
+    """Placeholder config file for CLI commands whose config loader is patched out."""
+    config_path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    config_path.write_text("dummy: true")
+    return config_path
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from datetime import datetime
 
-from typer.testing import CliRunner
+import orjson
+import pytest
 
-from dam_automation.main import app as cli_app
+from dam_automation import main as _main
+from dam_automation.main import create_datasource, delete_datasource, drop_snowflake_objects
 from dam_automation.models import (
     DatasourceRecord,
     DatasourceRequest,
@@ -17,8 +18,9 @@ from dam_automation.service import DatasourceAutomationService
 from dam_automation.snowflake import SnowflakeDropSummary
 
 
-def _sample_record(name: str = "example") -> DatasourceRecord:
-    request = DatasourceRequest(name=name)
+@pytest.fixture(scope="module")
+def sample_record() -> DatasourceRecord:
+    request = DatasourceRequest(name="example")
     resources = DatasourceResources(
         container_url="abfss://example@acct.dfs.core.windows.net/",
         managed_identity_id="identity",
@@ -32,24 +34,21 @@ def _sample_record(name: str = "example") -> DatasourceRecord:
         snowflake_external_volume_name="volume",
         snowflake_catalog_integration_name="integration",
         snowflake_database_name="database",
+        created_at=datetime(2024, 1, 1),
     )
-    return DatasourceRecord(request=request, resources=resources)
+    return DatasourceRecord(request=request, resources=resources, updated_at=datetime(2024, 1, 1))
 
 
 def _patch_service(monkeypatch, factory):
-    monkeypatch.setattr("dam_automation.main.DatasourceAutomationService", factory)
+    monkeypatch.setattr(_main, "DatasourceAutomationService", factory)
 
 
 def _patch_config(monkeypatch, config_obj) -> None:
-    monkeypatch.setattr("dam_automation.main.load_config", lambda _: config_obj)
+    monkeypatch.setattr(_main, "load_config", lambda _: config_obj)
 
 
-def test_create_datasource_command_outputs_json(tmp_path, monkeypatch) -> None:
-    runner = CliRunner()
-    config_path = Path(tmp_path) / "config.yaml"
-    config_path.write_text("dummy: true")
-
-    record = _sample_record()
+def test_create_datasource_command_outputs_json(dummy_config_path, monkeypatch, capsys, sample_record) -> None:
+    record = sample_record
 
     class DummyService(DatasourceAutomationService):  # type: ignore[misc]
         def __init__(self, cfg) -> None:
@@ -61,23 +60,15 @@ def test_create_datasource_command_outputs_json(tmp_path, monkeypatch) -> None:
     _patch_config(monkeypatch, config_obj={"dummy": True})
     _patch_service(monkeypatch, DummyService)
 
-    result = runner.invoke(
-        cli_app,
-        ["create-datasource", "example", "--config", str(config_path)],
-    )
+    create_datasource(name="example", config=dummy_config_path, description=None, owner=None)
 
-    assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    payload = orjson.loads(capsys.readouterr().out)
     assert payload["datasource"] == "example"
     assert payload["catalog"] == "catalog"
     assert payload["storage_credential"] == "cred"
 
 
-def test_drop_snowflake_command_reports_summary(tmp_path, monkeypatch) -> None:
-    runner = CliRunner()
-    config_path = Path(tmp_path) / "config.yaml"
-    config_path.write_text("dummy: true")
-
+def test_drop_snowflake_command_reports_summary(dummy_config_path, monkeypatch, capsys) -> None:
     summary = SnowflakeDropSummary(
         external_volume_dropped=True,
         catalog_integration_dropped=False,
@@ -95,24 +86,16 @@ def test_drop_snowflake_command_reports_summary(tmp_path, monkeypatch) -> None:
     _patch_config(monkeypatch, config_obj={"dummy": True})
     _patch_service(monkeypatch, DummyService)
 
-    result = runner.invoke(
-        cli_app,
-        ["drop-snowflake", "example", "--config", str(config_path)],
-    )
+    drop_snowflake_objects(name="example", config=dummy_config_path)
 
-    assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    payload = orjson.loads(capsys.readouterr().out)
     assert payload["datasource"] == "example"
     assert payload["snowflake_database_dropped"] is True
     assert payload["snowflake_catalog_integration_dropped"] is False
     assert payload["snowflake_external_volume_dropped"] is True
 
 
-def test_delete_datasource_command_handles_state_missing(tmp_path, monkeypatch) -> None:
-    runner = CliRunner()
-    config_path = Path(tmp_path) / "config.yaml"
-    config_path.write_text("dummy: true")
-
+def test_delete_datasource_command_handles_state_missing(dummy_config_path, monkeypatch, capsys) -> None:
     deletion_result = DatasourceDeletionResult(
         input_name="example",
         normalized_name="example",
@@ -136,13 +119,10 @@ def test_delete_datasource_command_handles_state_missing(tmp_path, monkeypatch)
     _patch_config(monkeypatch, config_obj={"dummy": True})
     _patch_service(monkeypatch, DummyService)
 
-    result = runner.invoke(
-        cli_app,
-        ["delete-datasource", "example", "--config", str(config_path)],
-    )
+    delete_datasource(name="example", config=dummy_config_path)
 
-    assert result.exit_code == 0
-    payload = json.loads(result.stdout)
+    captured = capsys.readouterr()
+    payload = orjson.loads(captured.out)
     assert payload["datasource"] == "example"
     assert payload["state_found"] is False
-    assert "State record not found" in result.stderr
+    assert "State record not found" in captured.err
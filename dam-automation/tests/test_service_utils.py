@@ -3,6 +3,8 @@ from __future__ import annotations
 from types import SimpleNamespace
 from typing import Optional
 
+import pytest
+
 from dam_automation.models import DatasourceRequest
 from dam_automation.service import DatasourceAutomationService
 
@@ -46,8 +48,12 @@ def _service_with_prefix(
     return service
 
 
-def test_normalize_name_applies_qualifier_and_truncates() -> None:
-    service = _service_with_prefix()
+@pytest.fixture(scope="module")
+def service() -> DatasourceAutomationService:
+    return _service_with_prefix()
+
+
+def test_normalize_name_applies_qualifier_and_truncates(service) -> None:
     raw = "My Fancy/Data_Source Name!!" + "X" * 100
 
     result = service._normalize_name(raw)
@@ -74,32 +80,43 @@ def test_build_tags_includes_owner_and_labels() -> None:
     assert tags["team"] == "data"
 
 
-def test_derive_ro_group_name_handles_suffixes() -> None:
-    service = _service_with_prefix()
-
-    assert service._derive_ro_group_name("example-rw", "example") == "example-ro"
-    assert service._derive_ro_group_name("example_rw", "fallback") == "example-ro"
-    assert service._derive_ro_group_name("example", "fallback") == "fallback-ro"
-
-
-def test_extract_container_name_parses_urls() -> None:
-    service = _service_with_prefix()
-
-    url = "abfss://sample@storageacct.dfs.core.windows.net/path"
-    assert service._extract_container_name(url) == "sample"
-    assert service._extract_container_name("container") == "container"
-    assert service._extract_container_name("") == ""
-
-
-def test_extract_identity_name_returns_last_segment() -> None:
-    service = _service_with_prefix()
-    resource = (
-        "/subscriptions/sub/resourceGroups/rg/providers/Microsoft.ManagedIdentity"
-        "/userAssignedIdentities/example-id"
-    )
-
-    assert service._extract_identity_name(resource, "fallback") == "example-id"
-    assert service._extract_identity_name("", "fallback") == "fallback"
+@pytest.mark.parametrize(
+    ("group", "fallback", "expected"),
+    [
+        ("example-rw", "example", "example-ro"),
+        ("example_rw", "fallback", "example-ro"),
+        ("example", "fallback", "fallback-ro"),
+    ],
+)
+def test_derive_ro_group_name_handles_suffixes(service, group: str, fallback: str, expected: str) -> None:
+    assert service._derive_ro_group_name(group, fallback) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("abfss://sample@storageacct.dfs.core.windows.net/path", "sample"),
+        ("container", "container"),
+        ("", ""),
+    ],
+)
+def test_extract_container_name_parses_urls(service, value: str, expected: str) -> None:
+    assert service._extract_container_name(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("resource", "expected"),
+    [
+        (
+            "/subscriptions/sub/resourceGroups/rg/providers/Microsoft.ManagedIdentity"
+            "/userAssignedIdentities/example-id",
+            "example-id",
+        ),
+        ("", "fallback"),
+    ],
+)
+def test_extract_identity_name_returns_last_segment(service, resource: str, expected: str) -> None:
+    assert service._extract_identity_name(resource, "fallback") == expected
 
 
 def test_to_azure_storage_base_url_transforms_scheme() -> None:
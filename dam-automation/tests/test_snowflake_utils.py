@@ -27,6 +27,16 @@ def test_log_ddl_masks_sensitive_values(caplog) -> None:
     assert all("super-secret" not in message for message in caplog.messages)
 
 
+def test_log_ddl_masks_overlapping_values(caplog) -> None:
+    provisioner = SnowflakeProvisioner(_config())
+    caplog.set_level("DEBUG")
+
+    ddl = "ALTER SECRET SET A = 'abc', B = 'abcdef'"
+    provisioner._log_ddl(ddl, ["abc", "", "abcdef"])
+
+    assert any("A = '***', B = '***'" in message for message in caplog.messages)
+
+
 def test_drop_summary_flags() -> None:
     summary = SnowflakeDropSummary(
         external_volume_dropped=True,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 
+import pytest
+
 from dam_automation.models import DatasourceRecord, DatasourceRequest, DatasourceResources
 from dam_automation.state import StateStore
 
@@ -25,22 +28,25 @@ def _resources(created_at: datetime | None = None) -> DatasourceResources:
     )
 
 
-def _record(name: str = "example") -> DatasourceRecord:
+@pytest.fixture(scope="module")
+def record_prototype() -> DatasourceRecord:
     request = DatasourceRequest(
-        name=name,
+        name="example",
         description="Example datasource",
         owner="owner@example.com",
         labels={"env": "test"},
     )
     resources = _resources()
-    record = DatasourceRecord(request=request, resources=resources)
-    record.updated_at = datetime(2024, 1, 2)
-    return record
+    return DatasourceRecord(request=request, resources=resources, updated_at=datetime(2024, 1, 2))
+
+
+def _record(prototype: DatasourceRecord, name: str) -> DatasourceRecord:
+    return replace(prototype, request=replace(prototype.request, name=name))
 
 
-def test_state_round_trip(tmp_path) -> None:
+def test_state_round_trip(tmp_path, record_prototype) -> None:
     store = StateStore(tmp_path)
-    record = _record()
+    record = record_prototype
 
     store.save(record)
     loaded = store.get("example")
@@ -53,9 +59,9 @@ def test_state_round_trip(tmp_path) -> None:
     assert loaded.updated_at == record.updated_at
 
 
-def test_state_uses_sanitized_filenames(tmp_path) -> None:
+def test_state_uses_sanitized_filenames(tmp_path, record_prototype) -> None:
     store = StateStore(tmp_path)
-    record = _record("foo/bar")
+    record = _record(record_prototype, "foo/bar")
 
     store.save(record)
 
@@ -71,10 +77,10 @@ def test_state_uses_sanitized_filenames(tmp_path) -> None:
     assert not sanitized_path.exists()
 
 
-def test_list_records_returns_all_entries(tmp_path) -> None:
+def test_list_records_returns_all_entries(tmp_path, record_prototype) -> None:
     store = StateStore(tmp_path)
-    record_one = _record("alpha")
-    record_two = _record("beta")
+    record_one = _record(record_prototype, "alpha")
+    record_two = _record(record_prototype, "beta")
 
     store.save(record_one)
     store.save(record_two)
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import msgpack
+import pytest
+
 from dam_automation.models import DatasourceRecord, DatasourceRequest, DatasourceResources
 from dam_automation.state import (
     _deserialize_datetime,
@@ -11,7 +14,16 @@ from dam_automation.state import (
 )
 
 
-def _sample_record() -> DatasourceRecord:
+def _record_to_msgpack(record: DatasourceRecord) -> bytes:
+    return msgpack.packb(_record_to_json(record), use_bin_type=True)
+
+
+def _msgpack_to_record(payload: bytes) -> DatasourceRecord:
+    return _json_to_record(msgpack.unpackb(payload, raw=False))
+
+
+@pytest.fixture(scope="module")
+def record_prototype() -> DatasourceRecord:
     request = DatasourceRequest(name="sample")
     resources = DatasourceResources(
         container_url="abfss://sample@acct.dfs.core.windows.net/",
@@ -26,9 +38,9 @@ def _sample_record() -> DatasourceRecord:
         snowflake_external_volume_name="sample",
         snowflake_catalog_integration_name="sample",
         snowflake_database_name="sample_db",
+        created_at=datetime(2024, 1, 1, 0, 0, 0),
     )
-    record = DatasourceRecord(request=request, resources=resources)
-    return record
+    return DatasourceRecord(request=request, resources=resources, updated_at=datetime(2024, 1, 2, 0, 0, 0))
 
 
 def test_serialize_datetime_trims_microseconds() -> None:
@@ -39,13 +51,16 @@ def test_serialize_datetime_trims_microseconds() -> None:
     assert deserialized == datetime(2024, 1, 2, 3, 4, 5)
 
 
-def test_record_to_json_and_back_round_trip() -> None:
-    record = _sample_record()
-    record.resources.created_at = datetime(2024, 1, 1, 0, 0, 0)
-    record.updated_at = datetime(2024, 1, 2, 0, 0, 0)
+@pytest.mark.parametrize(
+    ("encode", "decode"),
+    [(_record_to_json, _json_to_record), (_record_to_msgpack, _msgpack_to_record)],
+    ids=["json", "msgpack"],
+)
+def test_record_round_trip(record_prototype, encode, decode) -> None:
+    record = record_prototype
 
-    payload = _record_to_json(record)
-    restored = _json_to_record(payload)
+    payload = encode(record)
+    restored = decode(payload)
 
     assert restored.request == record.request
     assert restored.resources == record.resources
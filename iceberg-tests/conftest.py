@@ -0,0 +1,14 @@
+import pytest
+
+from framework.cli import load_bundle
+from framework.config import ConfigBundle
+
+
+@pytest.fixture(scope="session")
+def framework_bundle() -> ConfigBundle:
+    """Load ``.env`` and config/framework.yaml once per test session.
+
+    Pass the bundle to ``Runner(framework_bundle)`` or ``main(argv, bundle=framework_bundle)``
+    to skip re-reading and re-validating the configuration for every run.
+    """
+    return load_bundle()
@@ -5,24 +5,92 @@ import json
 import logging
 import os
 import sys
-from typing import Dict
+from typing import Any, Dict
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError
 
-from .config import load_framework_config
-from .runner import Runner
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+from .config import ConfigBundle, load_framework_config
+from .runner import PlanReport, Runner, StepReport, summarize_status
+
+logger = logging.getLogger(__name__)
+
+_REPORT_ADAPTER = TypeAdapter(PlanReport)
+_STEP_ADAPTER = TypeAdapter(StepReport)
 
 
 def _parse_kv(pairs: list[str]) -> Dict[str, str]:
     result: Dict[str, str] = {}
     for pair in pairs:
-        if "=" not in pair:
+        key, sep, value = pair.partition("=")
+        if not sep:
             raise ValueError(f"Invalid --var '{pair}', expected KEY=VALUE")
-        key, value = pair.split("=", 1)
         result[key] = value
     return result
 
 
+def _serialize_default(obj: Any) -> Any:
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+def _dump_fallback(value: Any, indent: bool) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=_serialize_default, option=option)
+    return json.dumps(value, default=_serialize_default, indent=2 if indent else None).encode()
+
+
+def _dump_json(adapter: TypeAdapter, value: Any, indent: bool) -> bytes:
+    try:
+        return adapter.dump_json(value, indent=2 if indent else None, by_alias=True)
+    except PydanticSerializationError:
+        # Result rows can carry driver-specific values pydantic-core does not know about.
+        return _dump_fallback(value, indent)
+
+
+def _write_line(payload: bytes) -> None:
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def emit_json_report(report: PlanReport) -> None:
+    _write_line(_dump_json(_REPORT_ADAPTER, report, indent=True))
+
+
+def stream_json_report(
+    runner: Runner, plan_name: str, namespace: str, extra_variables: Dict[str, Any]
+) -> str:
+    """Run a plan and emit NDJSON: a header line, one line per step, then a status line."""
+    report = runner.start_plan(plan_name, namespace)
+    header = {"plan": report.plan, "namespace": report.namespace, "run_id": report.run_id}
+    _write_line(_dump_fallback(header, indent=False))
+
+    statuses = []
+    for step_report in runner.iter_steps(report, extra_variables):
+        statuses.append(step_report.status)
+        _write_line(_dump_json(_STEP_ADAPTER, step_report, indent=False))
+
+    status = summarize_status(statuses)
+    logger.info("Plan '%s' completed with status %s", report.plan.name, status)
+    _write_line(_dump_fallback({"status": status}, indent=False))
+    return status
+
+
 def configure_logging(level: str) -> None:
     logging.basicConfig(
         level=getattr(logging, level.upper(), logging.INFO),
@@ -31,44 +99,62 @@ def configure_logging(level: str) -> None:
     )
 
 
-def main(argv: list[str] | None = None) -> int:
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    load_dotenv(os.path.join(project_root, ".env"), override=False)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_PATH = os.path.join(_PROJECT_ROOT, "config", "framework.yaml")
+
+
+def load_env() -> None:
+    """Load the project ``.env`` without overriding variables already set."""
+    load_dotenv(os.path.join(_PROJECT_ROOT, ".env"), override=False)
 
+
+def load_bundle(config_path: str = DEFAULT_CONFIG_PATH) -> ConfigBundle:
+    """Load ``.env`` and the framework config; callers running many plans can do this once."""
+    load_env()
+    return load_framework_config(config_path)
+
+
+def main(argv: list[str] | None = None, bundle: ConfigBundle | None = None) -> int:
     parser = argparse.ArgumentParser(description="Iceberg interoperability test runner")
-    parser.add_argument("--config", default=os.path.join(project_root, "config", "framework.yaml"))
+    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH, help="Ignored when a preloaded bundle is passed")
     parser.add_argument("--plan", required=True, help="Plan name to execute")
     parser.add_argument("--namespace", required=True, help="Namespace for the test run")
     parser.add_argument("--var", action="append", default=[], help="Additional template variable KEY=VALUE")
     parser.add_argument("--log-level", default="INFO", help="Logging level (INFO, DEBUG, ...)")
     parser.add_argument("--json", action="store_true", help="Emit run report as JSON")
+    parser.add_argument(
+        "--json-stream",
+        action="store_true",
+        help="Emit run report as NDJSON, one line per step as it completes",
+    )
     args = parser.parse_args(argv)
 
     configure_logging(args.log_level)
 
-    try:
-        bundle = load_framework_config(args.config)
-    except Exception as exc:  # noqa: BLE001
-        logging.getLogger(__name__).error("Failed to load config: %s", exc)
-        return 1
+    if bundle is None:
+        try:
+            bundle = load_bundle(args.config)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Failed to load config: %s", exc)
+            return 1
+    else:
+        # Engine adapters read credentials from the environment, so .env is loaded
+        # even when the caller hands in a preloaded bundle.
+        load_env()
 
     extra_variables = _parse_kv(args.var)
 
     runner = Runner(bundle)
     try:
+        if args.json_stream:
+            status = stream_json_report(runner, args.plan, args.namespace, extra_variables)
+            return 0 if status == "passed" else 1
         report = runner.run_plan(args.plan, args.namespace, extra_variables)
     finally:
         runner.close()
 
     if args.json:
-        def serialize(obj):
-            if hasattr(obj, "model_dump"):
-                return obj.model_dump()
-            if hasattr(obj, "__dict__"):
-                return obj.__dict__
-            return str(obj)
-
-        print(json.dumps(report, default=serialize, indent=2))
+        emit_json_report(report)
     else:
         print(f"Plan: {report.plan.name} (status={report.status})")
         for step_report in report.steps:
@@ -1,72 +1,317 @@
+import copy
+import functools
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError, ConfigDict
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
-class StorageConfig(BaseModel):
+
+class ConfigError(ValueError):
+    """Raised when the framework configuration is missing or has malformed entries."""
+
+
+def _require(data: Mapping[str, Any], key: str, owner: str) -> Any:
+    value = data.get(key)
+    if value is None:
+        raise ConfigError(f"{owner}: missing required field '{key}'")
+    return value
+
+
+def _mapping(data: Mapping[str, Any], key: str, owner: str) -> Dict[str, Any]:
+    value = data.get(key)
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ConfigError(f"{owner}: field '{key}' must be a mapping")
+    return value
+
+
+def _sequence(data: Mapping[str, Any], key: str, owner: str) -> List[Any]:
+    value = data.get(key)
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ConfigError(f"{owner}: field '{key}' must be a list")
+    return value
+
+
+def _optional_str(data: Mapping[str, Any], key: str) -> Optional[str]:
+    value = data.get(key)
+    return None if value is None else str(value)
+
+
+_TRUE_STRINGS = frozenset({"true", "t", "yes", "y", "on", "1"})
+_FALSE_STRINGS = frozenset({"false", "f", "no", "n", "off", "0"})
+
+
+def _parse_bool(data: Mapping[str, Any], key: str, owner: str, default: bool) -> bool:
+    value = data.get(key)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ConfigError(f"{owner}: field '{key}' must be a boolean, got {value!r}")
+
+
+def _script_path(value: Any, owner: str) -> str:
+    if not isinstance(value, str):
+        raise ConfigError(f"{owner}: script path must be a string, got {value!r}")
+    return value
+
+
+def _as_mapping(data: Any, owner: str) -> Mapping[str, Any]:
+    if not isinstance(data, dict):
+        raise ConfigError(f"{owner}: expected a mapping")
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class StorageConfig:
     warehouse_uri: Optional[str] = None
     staging_uri: Optional[str] = None
     account: Optional[str] = None
     container: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "StorageConfig":
+        data = _as_mapping(data, "storage")
+        return cls(
+            warehouse_uri=_optional_str(data, "warehouse_uri"),
+            staging_uri=_optional_str(data, "staging_uri"),
+            account=_optional_str(data, "account"),
+            container=_optional_str(data, "container"),
+        )
 
-class CatalogConfig(BaseModel):
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "warehouse_uri": self.warehouse_uri,
+            "staging_uri": self.staging_uri,
+            "account": self.account,
+            "container": self.container,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogConfig:
     name: str
     type: str
     description: Optional[str] = None
-    options: Dict[str, Any] = Field(default_factory=dict)
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "catalog") -> "CatalogConfig":
+        data = _as_mapping(data, owner)
+        return cls(
+            name=str(_require(data, "name", owner)),
+            type=str(_require(data, "type", owner)),
+            description=_optional_str(data, "description"),
+            options=_mapping(data, "options", owner),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "options": copy.deepcopy(self.options),
+        }
 
 
-class EngineCatalogOverride(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
-    session_conf: Dict[str, Any] = Field(default_factory=dict)
-    sql_variables: Dict[str, Any] = Field(default_factory=dict)
-    options: Dict[str, Any] = Field(default_factory=dict)
+@dataclass(frozen=True, slots=True)
+class EngineCatalogOverride:
+    session_conf: Dict[str, Any] = field(default_factory=dict)
+    sql_variables: Dict[str, Any] = field(default_factory=dict)
+    options: Dict[str, Any] = field(default_factory=dict)
     database: Optional[str] = None
-    schema_name: Optional[str] = Field(default=None, alias="schema")
+    schema_name: Optional[str] = None
 
-    def model_dump(self, *args, **kwargs):
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(*args, **kwargs)
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "catalog_override") -> "EngineCatalogOverride":
+        data = _as_mapping(data, owner)
+        schema_name = data.get("schema", data.get("schema_name"))
+        return cls(
+            session_conf=_mapping(data, "session_conf", owner),
+            sql_variables=_mapping(data, "sql_variables", owner),
+            options=_mapping(data, "options", owner),
+            database=_optional_str(data, "database"),
+            schema_name=None if schema_name is None else str(schema_name),
+        )
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_conf": copy.deepcopy(self.session_conf),
+            "sql_variables": copy.deepcopy(self.sql_variables),
+            "options": copy.deepcopy(self.options),
+            "database": self.database,
+            "schema": self.schema_name,
+        }
 
-class EngineConfig(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class EngineConfig:
     name: str
     type: str
     enabled: bool = True
     default_catalog: Optional[str] = None
-    connection: Dict[str, Any] = Field(default_factory=dict)
-    session_conf: Dict[str, Any] = Field(default_factory=dict)
-    sql_variables: Dict[str, Any] = Field(default_factory=dict)
-    catalog_overrides: Dict[str, EngineCatalogOverride] = Field(default_factory=dict)
+    connection: Dict[str, Any] = field(default_factory=dict)
+    session_conf: Dict[str, Any] = field(default_factory=dict)
+    sql_variables: Dict[str, Any] = field(default_factory=dict)
+    catalog_overrides: Dict[str, EngineCatalogOverride] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "engine") -> "EngineConfig":
+        data = _as_mapping(data, owner)
+        overrides = {
+            key: EngineCatalogOverride.from_dict(value or {}, f"{owner}.catalog_overrides.{key}")
+            for key, value in _mapping(data, "catalog_overrides", owner).items()
+        }
+        return cls(
+            name=str(_require(data, "name", owner)),
+            type=str(_require(data, "type", owner)),
+            enabled=_parse_bool(data, "enabled", owner, True),
+            default_catalog=_optional_str(data, "default_catalog"),
+            connection=_mapping(data, "connection", owner),
+            session_conf=_mapping(data, "session_conf", owner),
+            sql_variables=_mapping(data, "sql_variables", owner),
+            catalog_overrides=overrides,
+        )
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "enabled": self.enabled,
+            "default_catalog": self.default_catalog,
+            "connection": copy.deepcopy(self.connection),
+            "session_conf": copy.deepcopy(self.session_conf),
+            "sql_variables": copy.deepcopy(self.sql_variables),
+            "catalog_overrides": {key: value.to_dict() for key, value in self.catalog_overrides.items()},
+        }
 
-class DatasetColumn(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class DatasetColumn:
     name: str
     type: str
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "column") -> "DatasetColumn":
+        data = _as_mapping(data, owner)
+        return cls(name=str(_require(data, "name", owner)), type=str(_require(data, "type", owner)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "type": self.type}
 
-class DatasetConfig(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class DatasetConfig:
     name: str
     rows: int
     columns: List[DatasetColumn]
-    partition_spec: List[Dict[str, Any]] = Field(default_factory=list)
-    sort_order: List[str] = Field(default_factory=list)
-    table_properties: Dict[str, Any] = Field(default_factory=dict)
+    partition_spec: List[Dict[str, Any]] = field(default_factory=list)
+    sort_order: List[str] = field(default_factory=list)
+    table_properties: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "dataset") -> "DatasetConfig":
+        data = _as_mapping(data, owner)
+        try:
+            rows = int(_require(data, "rows", owner))
+        except (TypeError, ValueError) as exc:
+            raise ConfigError(f"{owner}: field 'rows' must be an integer") from exc
+        columns = [
+            DatasetColumn.from_dict(column, f"{owner}.columns[{index}]")
+            for index, column in enumerate(_require(data, "columns", owner))
+        ]
+        return cls(
+            name=str(_require(data, "name", owner)),
+            rows=rows,
+            columns=columns,
+            partition_spec=_sequence(data, "partition_spec", owner),
+            sort_order=[str(item) for item in _sequence(data, "sort_order", owner)],
+            table_properties=_mapping(data, "table_properties", owner),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rows": self.rows,
+            "columns": [column.to_dict() for column in self.columns],
+            "partition_spec": copy.deepcopy(self.partition_spec),
+            "sort_order": list(self.sort_order),
+            "table_properties": copy.deepcopy(self.table_properties),
+        }
 
 
-class TestCaseConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TestCaseConfig:
     name: str
-    description: Optional[str] = None
     scripts: Dict[str, Dict[str, str]]
-    variables: Dict[str, Any] = Field(default_factory=dict)
-    validations: List[Dict[str, Any]] = Field(default_factory=list)
+    description: Optional[str] = None
+    variables: Dict[str, Any] = field(default_factory=dict)
+    validations: List[Dict[str, Any]] = field(default_factory=list)
+    _resolved: Dict[Tuple[str, str], str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Exact (engine, catalog) pairs resolve to themselves; wildcard fallbacks are
+        # memoized by resolve_script the first time a combination is requested.
+        for engine, engine_map in self.scripts.items():
+            for catalog, script_path in engine_map.items():
+                if script_path:
+                    self._resolved[(engine, catalog)] = script_path
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "test_case") -> "TestCaseConfig":
+        data = _as_mapping(data, owner)
+        scripts = {
+            engine: {
+                catalog: _script_path(path, f"{owner}.scripts.{engine}.{catalog}")
+                for catalog, path in _as_mapping(mapping, f"{owner}.scripts.{engine}").items()
+            }
+            for engine, mapping in _as_mapping(_require(data, "scripts", owner), f"{owner}.scripts").items()
+        }
+        return cls(
+            name=str(_require(data, "name", owner)),
+            scripts=scripts,
+            description=_optional_str(data, "description"),
+            variables=_mapping(data, "variables", owner),
+            validations=_sequence(data, "validations", owner),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "scripts": copy.deepcopy(self.scripts),
+            "variables": copy.deepcopy(self.variables),
+            "validations": copy.deepcopy(self.validations),
+        }
 
     def resolve_script(self, engine: str, catalog: str) -> str:
+        key = (engine, catalog)
+        script_path = self._resolved.get(key)
+        if script_path is None:
+            script_path = self._resolve_fallback(engine, catalog)
+            self._resolved[key] = script_path
+        return script_path
+
+    def _resolve_fallback(self, engine: str, catalog: str) -> str:
         engine_map = self.scripts.get(engine) or self.scripts.get("*")
         if not engine_map:
             raise KeyError(f"No scripts registered for engine '{engine}' in test case '{self.name}'")
@@ -78,30 +323,116 @@ class TestCaseConfig(BaseModel):
         return script_path
 
 
-class PlanStepConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PlanStepConfig:
     name: str
     test_case: str
     engine: str
     catalog: str
     dataset: Optional[str] = None
-    variables: Dict[str, Any] = Field(default_factory=dict)
+    variables: Dict[str, Any] = field(default_factory=dict)
     continue_on_error: bool = False
-    validations: List[Dict[str, Any]] = Field(default_factory=list)
+    validations: List[Dict[str, Any]] = field(default_factory=list)
+    depends_on: Optional[List[str]] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "step") -> "PlanStepConfig":
+        data = _as_mapping(data, owner)
+        depends_on = data.get("depends_on")
+        if depends_on is not None:
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
+            elif not isinstance(depends_on, list):
+                raise ConfigError(f"{owner}: field 'depends_on' must be a list of step names")
+            depends_on = [str(name) for name in depends_on]
+        return cls(
+            name=str(_require(data, "name", owner)),
+            test_case=str(_require(data, "test_case", owner)),
+            engine=str(_require(data, "engine", owner)),
+            catalog=str(_require(data, "catalog", owner)),
+            dataset=_optional_str(data, "dataset"),
+            variables=_mapping(data, "variables", owner),
+            continue_on_error=_parse_bool(data, "continue_on_error", owner, False),
+            validations=_sequence(data, "validations", owner),
+            depends_on=depends_on,
+        )
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "test_case": self.test_case,
+            "engine": self.engine,
+            "catalog": self.catalog,
+            "dataset": self.dataset,
+            "variables": copy.deepcopy(self.variables),
+            "continue_on_error": self.continue_on_error,
+            "validations": copy.deepcopy(self.validations),
+            "depends_on": None if self.depends_on is None else list(self.depends_on),
+        }
 
-class PlanConfig(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class PlanConfig:
     name: str
-    description: Optional[str] = None
     steps: List[PlanStepConfig]
+    description: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "plan") -> "PlanConfig":
+        data = _as_mapping(data, owner)
+        steps = [
+            PlanStepConfig.from_dict(step, f"{owner}.steps[{index}]")
+            for index, step in enumerate(_require(data, "steps", owner))
+        ]
+        return cls(
+            name=str(_require(data, "name", owner)),
+            steps=steps,
+            description=_optional_str(data, "description"),
+        )
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "steps": [step.to_dict() for step in self.steps],
+        }
 
-class FrameworkConfig(BaseModel):
-    storage: StorageConfig = Field(default_factory=StorageConfig)
-    catalogs: Dict[str, CatalogConfig] = Field(default_factory=dict)
-    engines: Dict[str, EngineConfig] = Field(default_factory=dict)
-    datasets: Dict[str, DatasetConfig] = Field(default_factory=dict)
-    test_cases: Dict[str, TestCaseConfig] = Field(default_factory=dict)
-    plans: Dict[str, PlanConfig] = Field(default_factory=dict)
+
+@dataclass(frozen=True, slots=True)
+class FrameworkConfig:
+    storage: StorageConfig = field(default_factory=StorageConfig)
+    catalogs: Dict[str, CatalogConfig] = field(default_factory=dict)
+    engines: Dict[str, EngineConfig] = field(default_factory=dict)
+    datasets: Dict[str, DatasetConfig] = field(default_factory=dict)
+    test_cases: Dict[str, TestCaseConfig] = field(default_factory=dict)
+    plans: Dict[str, PlanConfig] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "FrameworkConfig":
+        data = _as_mapping(data, "framework")
+        return cls(
+            storage=StorageConfig.from_dict(data.get("storage") or {}),
+            catalogs={
+                key: CatalogConfig.from_dict(value, f"catalogs.{key}")
+                for key, value in _mapping(data, "catalogs", "framework").items()
+            },
+            engines={
+                key: EngineConfig.from_dict(value, f"engines.{key}")
+                for key, value in _mapping(data, "engines", "framework").items()
+            },
+            datasets={
+                key: DatasetConfig.from_dict(value, f"datasets.{key}")
+                for key, value in _mapping(data, "datasets", "framework").items()
+            },
+            test_cases={
+                key: TestCaseConfig.from_dict(value, f"test_cases.{key}")
+                for key, value in _mapping(data, "test_cases", "framework").items()
+            },
+            plans={
+                key: PlanConfig.from_dict(value, f"plans.{key}")
+                for key, value in _mapping(data, "plans", "framework").items()
+            },
+        )
 
 
 @dataclass
@@ -110,19 +441,60 @@ class ConfigBundle:
     framework: FrameworkConfig
 
 
+# Same syntax as posixpath.expandvars ($NAME / ${NAME}); unset variables are left untouched.
+_ENV_VAR_RE = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+
+
+def _substitute_env_var(match: re.Match) -> str:
+    name = match.group(1)
+    if name.startswith("{"):
+        name = name[1:-1]
+    return os.environ.get(name, match.group(0))
+
+
 def _expand_env_vars(raw_text: str) -> str:
-    return os.path.expandvars(raw_text)
+    if "$" not in raw_text:
+        return raw_text
+    return _ENV_VAR_RE.sub(_substitute_env_var, raw_text)
 
 
-def load_framework_config(config_path: str) -> ConfigBundle:
-    path = Path(config_path).expanduser().resolve()
+def _expand_env_leaves(value: Any) -> Any:
+    """Expand environment variables in parsed string values only, never in YAML syntax."""
+    if isinstance(value, str):
+        return _expand_env_vars(value)
+    if isinstance(value, dict):
+        return {key: _expand_env_leaves(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_expand_env_leaves(item) for item in value]
+    return value
+
+
+def _load_uncached(path: Path) -> ConfigBundle:
     raw_text = path.read_text()
-    expanded = _expand_env_vars(raw_text)
-    data = yaml.safe_load(expanded) or {}
+    data = yaml.load(raw_text, Loader=_YamlLoader) or {}
+    if "$" in raw_text:
+        data = _expand_env_leaves(data)
 
     try:
-        framework = FrameworkConfig.model_validate(data)
-    except ValidationError as exc:
+        framework = FrameworkConfig.from_dict(data)
+    except ConfigError as exc:
         raise RuntimeError(f"Invalid framework configuration: {exc}") from exc
 
     return ConfigBundle(root=path.parent, framework=framework)
+
+
+def _config_cache_enabled() -> bool:
+    return os.environ.get("ICEBERG_TESTS_CONFIG_CACHE", "0").lower() in {"1", "true", "yes"}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int) -> ConfigBundle:
+    return _load_uncached(Path(path_str))
+
+
+def load_framework_config(config_path: str) -> ConfigBundle:
+    path = Path(config_path).expanduser().resolve()
+    if _config_cache_enabled():
+        # Keyed on mtime so edits to the YAML invalidate the cached bundle.
+        return _load_cached(str(path), path.stat().st_mtime_ns)
+    return _load_uncached(path)
@@ -3,16 +3,14 @@ from __future__ import annotations
 from pathlib import Path
 
 from .base import EngineFactory
-from .databricks import DatabricksEngineAdapter
-from .snowflake import SnowflakeEngineAdapter
-from .spark import SparkEngineAdapter
 
 __all__ = ["EngineFactory", "create_engine_factory"]
 
 
 def create_engine_factory(config_root: Path, framework_config) -> EngineFactory:
     factory = EngineFactory(config_root, framework_config.engines, framework_config.catalogs)
-    factory.register("spark", SparkEngineAdapter)
-    factory.register("snowflake", SnowflakeEngineAdapter)
-    factory.register("databricks", DatabricksEngineAdapter)
+    # Adapters pull in heavy driver SDKs, so they are only imported once a plan needs them.
+    factory.register_lazy("spark", f"{__name__}.spark", "SparkEngineAdapter")
+    factory.register_lazy("snowflake", f"{__name__}.snowflake", "SnowflakeEngineAdapter")
+    factory.register_lazy("databricks", f"{__name__}.databricks", "DatabricksEngineAdapter")
     return factory
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import importlib
 import logging
+from collections import ChainMap
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from ..config import CatalogConfig, EngineCatalogOverride, EngineConfig
 from ..sql import render_sql_statements
@@ -12,6 +14,42 @@ from ..sql import render_sql_statements
 logger = logging.getLogger(__name__)
 
 
+_OUTPUTLESS_KEYWORDS = frozenset(
+    {
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+        "MERGE",
+        "CREATE",
+        "DROP",
+        "ALTER",
+        "OPTIMIZE",
+        "VACUUM",
+        "TRUNCATE",
+        "USE",
+        "SET",
+        "CALL",
+        "CACHE",
+        "UNCACHE",
+    }
+)
+
+
+def keyword_prefixes(keywords: Iterable[str]) -> tuple[str, ...]:
+    """Build ``str.startswith`` prefixes matching each keyword followed by whitespace."""
+    return tuple(keyword + separator for keyword in keywords for separator in (" ", "\n", "\t", "\r"))
+
+
+_OUTPUTLESS_PREFIXES = keyword_prefixes(_OUTPUTLESS_KEYWORDS)
+_PREFIX_WIDTH = max(map(len, _OUTPUTLESS_PREFIXES))
+
+
+def is_outputless_statement(statement: str) -> bool:
+    """Return True for DDL/DML/session statements that produce no result rows."""
+    head = statement.lstrip()[:_PREFIX_WIDTH].upper()
+    return head.startswith(_OUTPUTLESS_PREFIXES) or head in _OUTPUTLESS_KEYWORDS
+
+
 @dataclass
 class StatementResult:
     statement: str
@@ -40,7 +78,7 @@ class EngineAdapter:
         self.catalog_config = catalog_config
         self.catalog_override = catalog_override or EngineCatalogOverride()
         self.config_root = config_root
-        self.catalog_context: Dict[str, Any] = self.catalog_override.model_dump()
+        self.catalog_context: Dict[str, Any] = self.catalog_override.to_dict()
         self.base_variables: Dict[str, Any] = {}
 
     def configure(self, variables: Dict[str, Any]) -> None:
@@ -49,29 +87,36 @@ class EngineAdapter:
         if isinstance(override_context, dict):
             self.catalog_context = override_context
         else:
-            self.catalog_context = self.catalog_override.model_dump()
+            self.catalog_context = self.catalog_override.to_dict()
         self.on_configure(variables)
 
     def on_configure(self, variables: Dict[str, Any]) -> None:
         """Hook for adapters that need to react to configuration changes."""
 
     def render_statements(self, sql_path: str, variables: Dict[str, Any]) -> List[str]:
-        merged = {**self.base_variables, **variables}
+        # Step variables shadow the configured base; a ChainMap avoids copying both.
+        merged = ChainMap(variables, self.base_variables)
         return render_sql_statements(self.config_root, sql_path, merged)
 
     def run(self, step_name: str, sql_path: str, variables: Dict[str, Any]) -> ExecutionResult:
         statements = self.render_statements(sql_path, variables)
-        logger.debug("[%s] Executing %d statements from %s", self.name, len(statements), sql_path)
-        for index, statement in enumerate(statements, 1):
-            log_message = "[%s] Statement %d:\n%s"
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(log_message, self.name, index, statement)
-            else:
-                logger.info(log_message, self.name, index, statement)
-        results = self.execute(statements)
-        return ExecutionResult(step_name=step_name, statements=results)
-
-    def execute(self, statements: Iterable[str]) -> List[StatementResult]:
+        if not statements:
+            # Nothing to send, so don't open a cursor or touch the session.
+            return ExecutionResult(step_name=step_name, statements=[])
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[%s] Executing %d statements from %s", self.name, len(statements), sql_path)
+        log = logger.debug if debug else logger.info
+        if debug or logger.isEnabledFor(logging.INFO):
+            for index, statement in enumerate(statements, 1):
+                log("[%s] Statement %d:\n%s", self.name, index, statement)
+        # Validations index statements from either end and the report serializes
+        # every statement, so the stream is materialized once here.
+        return ExecutionResult(step_name=step_name, statements=list(self.execute(statements)))
+
+    def execute(self, statements: Iterable[str]) -> Iterator[StatementResult]:
+        """Run ``statements`` in order, yielding each result as soon as it is available."""
         raise NotImplementedError
 
     def close(self) -> None:
@@ -84,10 +129,29 @@ class EngineFactory:
         self.engines = engines
         self.catalogs = catalogs
         self._registry: Dict[str, type[EngineAdapter]] = {}
+        self._lazy_registry: Dict[str, tuple[str, str]] = {}
         self._cache: Dict[tuple[str, str], EngineAdapter] = {}
 
     def register(self, engine_type: str, adapter_cls: type[EngineAdapter]) -> None:
         self._registry[engine_type] = adapter_cls
+        self._lazy_registry.pop(engine_type, None)
+
+    def register_lazy(self, engine_type: str, module_name: str, class_name: str) -> None:
+        """Register an adapter that is imported the first time its engine type is requested."""
+        self._lazy_registry[engine_type] = (module_name, class_name)
+        self._registry.pop(engine_type, None)
+
+    def _resolve_adapter_cls(self, engine_type: str) -> Optional[type[EngineAdapter]]:
+        adapter_cls = self._registry.get(engine_type)
+        lazy_entry = self._lazy_registry.get(engine_type) if adapter_cls is None else None
+        if lazy_entry is not None:
+            # Keep the lazy entry until the import succeeds so a failed driver import
+            # is raised again on the next lookup instead of looking unregistered.
+            module_name, class_name = lazy_entry
+            adapter_cls = getattr(importlib.import_module(module_name), class_name)
+            self._registry[engine_type] = adapter_cls
+            self._lazy_registry.pop(engine_type, None)
+        return adapter_cls
 
     def get(self, engine_name: str, catalog_name: str) -> EngineAdapter:
         key = (engine_name, catalog_name)
@@ -104,7 +168,7 @@ class EngineFactory:
         if not catalog_config:
             raise KeyError(f"Unknown catalog '{catalog_name}'")
 
-        adapter_cls = self._registry.get(engine_config.type)
+        adapter_cls = self._resolve_adapter_cls(engine_config.type)
         if not adapter_cls:
             raise KeyError(f"No adapter registered for engine type '{engine_config.type}'")
 
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from databricks import sql
 
-from .base import EngineAdapter, StatementResult
+from ..sql import strip_statement_terminator
+from .base import EngineAdapter, StatementResult, is_outputless_statement, keyword_prefixes
 
 logger = logging.getLogger(__name__)
 
+# Session statements change cursor state, so they always run on their own.
+_SESSION_KEYWORDS = frozenset({"USE", "SET"})
+_SESSION_PREFIXES = keyword_prefixes(_SESSION_KEYWORDS)
+
 
 class DatabricksEngineAdapter(EngineAdapter):
     def __init__(self, *args, **kwargs):
@@ -35,28 +40,79 @@ class DatabricksEngineAdapter(EngineAdapter):
         if schema:
             kwargs["schema"] = schema
 
-        self.max_result_rows = int(connection.get("max_result_rows", 200))
+        self.max_result_rows = int(connection.get("max_result_rows", 1024))
+        # Opt-in: send runs of output-less statements as one SQL scripting block.
+        self.batch_statements = bool(connection.get("batch_statements", False))
         logger.info("[databricks] Connecting to %s http_path=%s", server_hostname, http_path)
         self.conn = sql.connect(**kwargs)
+        self._cursor = None
+        self._debug = False
+
+    def _get_cursor(self):
+        if self._cursor is None:
+            self._cursor = self.conn.cursor(arraysize=self.max_result_rows)
+        return self._cursor
 
-    def execute(self, statements: Iterable[str]) -> List[StatementResult]:
-        results: List[StatementResult] = []
-        cursor = self.conn.cursor()
+    def _discard_cursor(self) -> None:
+        cursor, self._cursor = self._cursor, None
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:  # noqa: BLE001 - cursor may already be unusable
+                logger.debug("[databricks] Ignoring error while closing cursor", exc_info=True)
+
+    def execute(self, statements: Iterable[str]) -> Iterator[StatementResult]:
+        cursor = self._get_cursor()
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         try:
+            if not self.batch_statements:
+                for statement in statements:
+                    yield self._execute_one(cursor, statement)
+                return
+
+            pending: List[str] = []
             for statement in statements:
-                logger.debug("[databricks] Executing: %s", statement)
-                cursor.execute(statement)
-                description = cursor.description
-                if description:
-                    columns = [col[0] for col in description]
-                    rows = self._fetch_rows(cursor, columns)
-                else:
-                    rows = None
-                rowcount = cursor.rowcount if cursor.rowcount >= 0 else None
-                results.append(StatementResult(statement=statement, rows=rows, rowcount=rowcount))
-        finally:
-            cursor.close()
-        return results
+                if is_outputless_statement(statement) and not self._is_session_statement(statement):
+                    pending.append(statement)
+                    continue
+                yield from self._execute_batch(cursor, pending)
+                pending = []
+                yield self._execute_one(cursor, statement)
+            yield from self._execute_batch(cursor, pending)
+        except Exception:
+            # A failed statement can leave the cursor unusable; the next run opens a fresh one.
+            self._discard_cursor()
+            raise
+
+    @staticmethod
+    def _is_session_statement(statement: str) -> bool:
+        head = statement.lstrip()[:4].upper()
+        return head.startswith(_SESSION_PREFIXES) or head in _SESSION_KEYWORDS
+
+    def _execute_one(self, cursor, statement: str) -> StatementResult:
+        if self._debug:
+            logger.debug("[databricks] Executing: %s", statement)
+        cursor.execute(statement)
+        description = cursor.description
+        if description:
+            columns = [col[0] for col in description]
+            rows = self._fetch_rows(cursor, columns)
+        else:
+            rows = None
+        rowcount = cursor.rowcount if cursor.rowcount >= 0 else None
+        return StatementResult(statement=statement, rows=rows, rowcount=rowcount)
+
+    def _execute_batch(self, cursor, group: List[str]) -> List[StatementResult]:
+        if len(group) < 2:
+            return [self._execute_one(cursor, statement) for statement in group]
+        # The terminator goes on its own line so a trailing line comment cannot swallow it.
+        body = "\n".join(f"  {strip_statement_terminator(statement)}\n  ;" for statement in group)
+        combined = f"BEGIN\n{body}\nEND"
+        if self._debug:
+            logger.debug("[databricks] Executing batch of %d statements:\n%s", len(group), combined)
+        cursor.execute(combined)
+        # Per-statement row counts are not reported for a compound block.
+        return [StatementResult(statement=statement, metadata={"batched": True}) for statement in group]
 
     def _fetch_rows(self, cursor, columns: List[str]) -> List[Dict[str, Any]]:
         rows: List[Dict[str, Any]] = []
@@ -64,16 +120,20 @@ class DatabricksEngineAdapter(EngineAdapter):
             table = cursor.fetchmany_arrow(self.max_result_rows)
             if not table or table.num_rows == 0:
                 break
-            records = table.to_pylist()
-            for record in records:
-                if isinstance(record, dict):
-                    rows.append({col: record.get(col) for col in columns})
-                else:
-                    rows.append({col: record[index] if index < len(record) else None for index, col in enumerate(columns)})
+            if table.column_names == columns:
+                rows.extend(table.to_pylist())
+            else:
+                available = set(table.column_names)
+                values = {
+                    col: table.column(col).to_pylist() if col in available else [None] * table.num_rows
+                    for col in columns
+                }
+                rows.extend({col: values[col][index] for col in columns} for index in range(table.num_rows))
             if table.num_rows < self.max_result_rows:
                 break
         return rows
 
     def close(self) -> None:
         logger.info("[databricks] Closing connection")
+        self._discard_cursor()
         self.conn.close()
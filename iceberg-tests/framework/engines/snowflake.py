@@ -1,15 +1,79 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Iterable, List, Optional
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import snowflake.connector
 from snowflake.connector import DictCursor
 
+from ..sql import strip_statement_terminator
 from .base import EngineAdapter, StatementResult
 
 logger = logging.getLogger(__name__)
 
+# Session parameters an adapter can switch with USE instead of opening its own connection.
+_SCOPE_KEYS = ("database", "schema")
+
+
+@dataclass
+class _PooledConnection:
+    ctx: Any
+    refs: int = 0
+    # Adapter whose database/schema is currently active on the session.
+    owner: Optional[object] = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+
+_CONN_POOL: Dict[tuple, _PooledConnection] = {}
+_POOL_LOCK = threading.Lock()
+
+# Loaded private keys keyed on (path, mtime, passphrase digest); the passphrase itself
+# is never kept, only used to decrypt on a miss.
+_KEY_CACHE_SIZE = 4
+_KEY_CACHE: "OrderedDict[tuple[str, int, Optional[str]], Any]" = OrderedDict()
+_KEY_CACHE_LOCK = threading.Lock()
+
+
+def _pool_key(connection: Dict[str, Any], key_path: Optional[str]) -> tuple:
+    """Key connections by everything except the database/schema scope, when one is given."""
+    scoped = bool(connection.get("database"))
+    items = [(key, repr(value)) for key, value in connection.items() if not (scoped and key in _SCOPE_KEYS)]
+    items.append(("private_key_path", repr(key_path)))
+    if not scoped:
+        # Unscoped sessions cannot be switched back, so they only share with each other.
+        items.append(("__unscoped__", "True"))
+    return tuple(sorted(items))
+
+
+def _load_private_key(key_path: str, key_pass: Optional[str]):
+    # Keyed on mtime so a rotated key file is picked up without restarting.
+    path = os.path.abspath(os.path.expanduser(key_path))
+    pass_digest = hashlib.blake2b(key_pass.encode(), digest_size=16).hexdigest() if key_pass else None
+    cache_key = (path, os.stat(path).st_mtime_ns, pass_digest)
+    with _KEY_CACHE_LOCK:
+        private_key = _KEY_CACHE.get(cache_key)
+        if private_key is not None:
+            _KEY_CACHE.move_to_end(cache_key)
+            return private_key
+
+    logger.debug("[snowflake] Using key pair auth")
+    from cryptography.hazmat.primitives import serialization
+
+    with open(path, "rb") as key_file:
+        private_key = serialization.load_pem_private_key(
+            key_file.read(), password=key_pass.encode() if key_pass else None
+        )
+    with _KEY_CACHE_LOCK:
+        _KEY_CACHE[cache_key] = private_key
+        if len(_KEY_CACHE) > _KEY_CACHE_SIZE:
+            _KEY_CACHE.popitem(last=False)
+    return private_key
+
 
 class SnowflakeEngineAdapter(EngineAdapter):
     def __init__(self, *args, **kwargs):
@@ -37,39 +101,111 @@ class SnowflakeEngineAdapter(EngineAdapter):
 
         key_path = connection.pop("private_key_path", None)
         key_pass = connection.pop("private_key_passphrase", None)
-        if key_path:
-            logger.debug("[snowflake] Using key pair auth")
-            from cryptography.hazmat.primitives import serialization
+        self.max_result_rows = int(connection.pop("max_result_rows", 1024))
+        self.fetch_all_rows = bool(connection.pop("fetch_all_rows", False))
+        # Opt-in: send each step's statements as one multi-statement request.
+        self.batch_statements = bool(connection.pop("batch_statements", False))
+        self.database: Optional[str] = connection.get("database")
+        self.schema: Optional[str] = connection.get("schema")
 
-            with open(key_path, "rb") as key_file:
-                private_key = serialization.load_pem_private_key(
-                    key_file.read(), password=key_pass.encode() if key_pass else None
-                )
-            connection["private_key"] = private_key
+        # Catalog overrides that differ only in database/schema share one session.
+        self._pool_key = _pool_key(connection, key_path)
+        with _POOL_LOCK:
+            pooled = _CONN_POOL.get(self._pool_key)
+            if pooled is None:
+                if key_path:
+                    connection["private_key"] = _load_private_key(key_path, key_pass)
+                pooled = _PooledConnection(ctx=snowflake.connector.connect(**connection), owner=self)
+                _CONN_POOL[self._pool_key] = pooled
+            else:
+                logger.info("[snowflake] Reusing pooled connection for database=%s schema=%s", self.database, self.schema)
+            pooled.refs += 1
+        self._pooled = pooled
+        self.ctx = pooled.ctx
+        self._cursor: Optional[DictCursor] = None
+
+    def _activate_scope(self, cursor: DictCursor) -> None:
+        """Point a shared session back at this adapter's database/schema if another adapter moved it."""
+        if self._pooled.owner is self:
+            return
+        # Names are used as configured, like connect(database=...) and the SQL scripts,
+        # so unquoted names resolve case-insensitively and quoted ones stay exact.
+        if self.database and self.schema:
+            cursor.execute(f"USE SCHEMA {self.database}.{self.schema}")
+        elif self.database:
+            cursor.execute(f"USE DATABASE {self.database}")
+        self._pooled.owner = self
+
+    def _get_cursor(self) -> DictCursor:
+        if self._cursor is None:
+            self._cursor = self.ctx.cursor(DictCursor)
+            self._cursor.arraysize = self.max_result_rows
+        return self._cursor
+
+    def _discard_cursor(self) -> None:
+        cursor, self._cursor = self._cursor, None
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:  # noqa: BLE001 - cursor may already be unusable
+                logger.debug("[snowflake] Ignoring error while closing cursor", exc_info=True)
 
-        self.max_result_rows = int(connection.pop("max_result_rows", 200))
-        self.ctx = snowflake.connector.connect(**connection)
+    def execute(self, statements: Iterable[str]) -> Iterator[StatementResult]:
+        with self._pooled.lock:
+            yield from self._execute_scoped(statements)
 
-    def execute(self, statements: Iterable[str]) -> List[StatementResult]:
-        results: List[StatementResult] = []
-        cursor: Optional[DictCursor] = None
+    def _execute_scoped(self, statements: Iterable[str]) -> Iterator[StatementResult]:
+        cursor = self._get_cursor()
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            cursor = self.ctx.cursor(DictCursor)
+            self._activate_scope(cursor)
+            statements = list(statements) if self.batch_statements else statements
+            if self.batch_statements and len(statements) > 1:
+                yield from self._execute_multi(cursor, statements, debug)
+                return
             for statement in statements:
-                logger.debug("[snowflake] Executing: %s", statement)
+                if debug:
+                    logger.debug("[snowflake] Executing: %s", statement)
                 cursor.execute(statement)
-                if cursor.description:
-                    fetched = cursor.fetchmany(self.max_result_rows)
-                    rows = [dict(row) for row in fetched]
-                else:
-                    rows = None
-                rowcount = cursor.rowcount if cursor.rowcount >= 0 else None
-                results.append(StatementResult(statement=statement, rows=rows, rowcount=rowcount))
-        finally:
-            if cursor is not None:
-                cursor.close()
-        return results
+                yield self._result(cursor, statement)
+        except Exception:
+            # A failed statement can leave the cursor unusable; the next run opens a fresh one.
+            self._discard_cursor()
+            raise
+
+    def _execute_multi(self, cursor: DictCursor, statements: List[str], debug: bool) -> Iterator[StatementResult]:
+        # Terminators go on their own line so a trailing line comment cannot swallow them.
+        combined = "\n;\n".join(strip_statement_terminator(statement) for statement in statements)
+        if debug:
+            logger.debug("[snowflake] Executing %d statements in one request:\n%s", len(statements), combined)
+        cursor.execute(combined, num_statements=len(statements))
+        for index, statement in enumerate(statements):
+            if index and not cursor.nextset():
+                raise RuntimeError(f"Snowflake returned {index} results for {len(statements)} statements")
+            yield self._result(cursor, statement)
+
+    def _result(self, cursor: DictCursor, statement: str) -> StatementResult:
+        rows = self._fetch_rows(cursor) if cursor.description else None
+        rowcount = cursor.rowcount if cursor.rowcount >= 0 else None
+        return StatementResult(statement=statement, rows=rows, rowcount=rowcount)
+
+    def _fetch_rows(self, cursor: DictCursor) -> List[Dict[str, Any]]:
+        # DictCursor already returns a fresh dict per row, so rows are kept as fetched.
+        if not self.fetch_all_rows:
+            return cursor.fetchmany(self.max_result_rows)
+        rows: List[Dict[str, Any]] = []
+        while batch := cursor.fetchmany(self.max_result_rows):
+            rows.extend(batch)
+        return rows
 
     def close(self) -> None:
+        self._discard_cursor()
+        with _POOL_LOCK:
+            self._pooled.refs -= 1
+            if self._pooled.owner is self:
+                self._pooled.owner = None
+            if self._pooled.refs > 0:
+                return
+            _CONN_POOL.pop(self._pool_key, None)
         logger.info("[snowflake] Closing connection")
         self.ctx.close()
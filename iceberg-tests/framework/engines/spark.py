@@ -1,34 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List
 
 from pyspark.sql import SparkSession
 
-from .base import EngineAdapter, StatementResult
+from .base import EngineAdapter, StatementResult, is_outputless_statement
 
 logger = logging.getLogger(__name__)
 
 
-_OUTPUTLESS_KEYWORDS = {
-    "INSERT",
-    "UPDATE",
-    "DELETE",
-    "MERGE",
-    "CREATE",
-    "DROP",
-    "ALTER",
-    "OPTIMIZE",
-    "VACUUM",
-    "TRUNCATE",
-    "USE",
-    "SET",
-    "CALL",
-    "CACHE",
-    "UNCACHE",
-}
-
-
 class SparkEngineAdapter(EngineAdapter):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -43,34 +24,48 @@ class SparkEngineAdapter(EngineAdapter):
         builder = SparkSession.builder.appName(app_name)
         if master:
             builder = builder.master(master)
-        for key, value in session_conf.items():
-            builder = builder.config(key, value)
+        if session_conf:
+            builder = builder.config(map=session_conf)
 
         logger.info("[spark] Starting SparkSession app=%s master=%s", app_name, master or "(default)")
         self.spark = builder.getOrCreate()
         self.max_result_rows = int(connection.get("max_result_rows", 200))
         self.capture_rowcount = bool(connection.get("capture_rowcount", False))
+        # Opt-in: capture rows through Arrow/pandas instead of building them from Row objects.
+        self.arrow_capture = bool(connection.get("arrow_capture", False))
+        if self.arrow_capture:
+            self.spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
 
     def _should_capture(self, statement: str) -> bool:
-        stripped = statement.lstrip()
-        keyword = stripped.split(" ", 1)[0].upper() if stripped else ""
-        return keyword not in _OUTPUTLESS_KEYWORDS
+        return not is_outputless_statement(statement)
 
-    def execute(self, statements: Iterable[str]) -> List[StatementResult]:
-        results: List[StatementResult] = []
+    def execute(self, statements: Iterable[str]) -> Iterator[StatementResult]:
+        debug = logger.isEnabledFor(logging.DEBUG)
         for statement in statements:
-            logger.debug("[spark] Executing: %s", statement)
+            if debug:
+                logger.debug("[spark] Executing: %s", statement)
             df = self.spark.sql(statement)
             if self._should_capture(statement):
-                rows_collected = df.take(self.max_result_rows)
-                rows = [row.asDict(recursive=True) for row in rows_collected]
-                rowcount = df.count() if self.capture_rowcount else len(rows)
+                rows = self._capture_rows(df)
+                # A capture shorter than the cap means the result is complete,
+                # so only fall back to a second full scan when it may have been truncated.
+                if self.capture_rowcount and len(rows) >= self.max_result_rows:
+                    rowcount = df.count()
+                else:
+                    rowcount = len(rows)
             else:
                 df.collect()
                 rows = None
                 rowcount = None
-            results.append(StatementResult(statement=statement, rows=rows, rowcount=rowcount))
-        return results
+            yield StatementResult(statement=statement, rows=rows, rowcount=rowcount)
+
+    def _capture_rows(self, df) -> List[Dict[str, Any]]:
+        if not self.arrow_capture:
+            return [row.asDict(recursive=True) for row in df.take(self.max_result_rows)]
+        pdf = df.limit(self.max_result_rows).toPandas()
+        # pandas represents SQL NULL as NaN/NaT; report them as None like the Row path does.
+        pdf = pdf.astype(object).where(pdf.notna(), None)
+        return pdf.to_dict(orient="records")
 
     def close(self) -> None:
         logger.info("[spark] Stopping SparkSession")
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from .config import ConfigBundle, PlanConfig, PlanStepConfig, TestCaseConfig
+from .config import (
+    CatalogConfig,
+    ConfigBundle,
+    EngineCatalogOverride,
+    EngineConfig,
+    PlanConfig,
+    PlanStepConfig,
+    TestCaseConfig,
+)
 from .engines import create_engine_factory
 from .engines.base import ExecutionResult
 from .sql import render_sql_template
@@ -32,11 +42,50 @@ class PlanReport:
 
     @property
     def status(self) -> str:
-        if any(step.status == "failed" for step in self.steps):
-            return "failed"
-        if all(step.status == "skipped" for step in self.steps):
-            return "skipped"
-        return "passed"
+        return summarize_status(step.status for step in self.steps)
+
+
+def summarize_status(step_statuses: Iterable[str]) -> str:
+    statuses = list(step_statuses)
+    if any(status == "failed" for status in statuses):
+        return "failed"
+    if all(status == "skipped" for status in statuses):
+        return "skipped"
+    return "passed"
+
+
+def _runs_concurrently(plan: PlanConfig) -> bool:
+    return any(step.depends_on is not None for step in plan.steps)
+
+
+def _resolve_dependencies(steps: List[PlanStepConfig]) -> Dict[str, set[str]]:
+    """Map each step to the steps it waits for; without depends_on a step waits for its predecessor."""
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError("Step names must be unique when depends_on is used")
+    dependencies: Dict[str, set[str]] = {}
+    previous: Optional[str] = None
+    for step in steps:
+        if step.depends_on is None:
+            dependencies[step.name] = {previous} if previous else set()
+        else:
+            unknown = [name for name in step.depends_on if name not in names]
+            if unknown:
+                raise KeyError(f"Step '{step.name}' depends on unknown steps: {', '.join(unknown)}")
+            dependencies[step.name] = set(step.depends_on)
+        previous = step.name
+
+    # Reject cycles up front; otherwise the scheduler would wait forever.
+    resolved: set[str] = set()
+    remaining = dict(dependencies)
+    while remaining:
+        ready = [name for name, deps in remaining.items() if deps <= resolved]
+        if not ready:
+            raise ValueError(f"Circular depends_on between steps: {', '.join(sorted(remaining))}")
+        for name in ready:
+            resolved.add(name)
+            del remaining[name]
+    return dependencies
 
 
 class Runner:
@@ -44,33 +93,59 @@ class Runner:
         self.bundle = bundle
         self.factory = create_engine_factory(bundle.root, bundle.framework)
         self.state: Dict[str, Any] = {}
+        # Locks only matter when a plan declares depends_on and steps run concurrently.
+        self._factory_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._adapter_locks: Dict[tuple[str, str], threading.Lock] = {}
+        # Config objects are frozen for the lifetime of the bundle, so their dumps can be shared.
+        self._dump_cache: Dict[int, Dict[str, Any]] = {}
+        self._storage_dump = bundle.framework.storage.to_dict()
+        # Entries shared by every step's base context; per-step keys are layered on top.
+        self._shared_base: Dict[str, Any] = {"storage": self._storage_dump, "state": self.state}
+        self._namespace_cache: Dict[tuple[str, str, str, str], tuple[str, Optional[Dict[str, Any]]]] = {}
+
+    def _dump(self, obj: Any) -> Dict[str, Any]:
+        dump = self._dump_cache.get(id(obj))
+        if dump is None:
+            dump = self._dump_cache[id(obj)] = obj.to_dict()
+        return dump
+
+    def _adapter_lock(self, engine: str, catalog: str) -> threading.Lock:
+        with self._factory_lock:
+            return self._adapter_locks.setdefault((engine, catalog), threading.Lock())
 
     def close(self) -> None:
         self.factory.close_all()
 
-    def _base_variables(
-        self, namespace: str, run_id: str, step: PlanStepConfig, test_case: TestCaseConfig
-    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
-        framework = self.bundle.framework
-        catalog_config = framework.catalogs.get(step.catalog)
-        engine_config = framework.engines.get(step.engine)
-        dataset_config = framework.datasets.get(step.dataset) if step.dataset else None
-        catalog_override = (
-            engine_config.catalog_overrides.get(step.catalog) if engine_config else None
-        )
+    def _resolve_namespace(
+        self,
+        namespace: str,
+        run_id: str,
+        step: PlanStepConfig,
+        catalog_config: Optional[CatalogConfig],
+        engine_config: Optional[EngineConfig],
+        catalog_override: Optional[EngineCatalogOverride],
+    ) -> tuple[str, Optional[Dict[str, Any]]]:
+        """Render the override options and target namespace for a step's engine/catalog pair."""
+        # Every input is fixed for a run, so steps sharing an engine/catalog reuse the result.
+        cache_key = (namespace, run_id, step.engine, step.catalog)
+        cached = self._namespace_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         render_context = {
             "namespace": namespace,
             "run_id": run_id,
-            "catalog": catalog_config.model_dump() if catalog_config else None,
-            "engine": engine_config.model_dump() if engine_config else None,
-            "storage": framework.storage.model_dump(),
+            "catalog": self._dump(catalog_config) if catalog_config else None,
+            "engine": self._dump(engine_config) if engine_config else None,
+            "storage": self._storage_dump,
         }
 
         target_namespace = namespace
         catalog_override_dict = None
         if catalog_override:
-            override_dump = catalog_override.model_dump()
+            # Copy: the options entry is replaced with its rendered values below.
+            override_dump = dict(self._dump(catalog_override))
             resolved_options: Dict[str, Any] = {}
             for key, value in override_dump.get("options", {}).items():
                 if isinstance(value, str) and "{{" in value:
@@ -89,27 +164,42 @@ class Runner:
                     sep = resolved_options.get("namespace_separator", ".")
                     target_namespace = f"{ns_root}{sep}{namespace}"
 
-        test_case_dict = test_case.model_dump()
+        resolved = self._namespace_cache[cache_key] = (target_namespace, catalog_override_dict)
+        return resolved
+
+    def _base_variables(
+        self, namespace: str, run_id: str, step: PlanStepConfig, test_case: TestCaseConfig, now_utc: str
+    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        framework = self.bundle.framework
+        catalog_config = framework.catalogs.get(step.catalog)
+        engine_config = framework.engines.get(step.engine)
+        dataset_config = framework.datasets.get(step.dataset) if step.dataset else None
+        catalog_override = (
+            engine_config.catalog_overrides.get(step.catalog) if engine_config else None
+        )
+
+        target_namespace, catalog_override_dict = self._resolve_namespace(
+            namespace, run_id, step, catalog_config, engine_config, catalog_override
+        )
+
+        test_case_dict = self._dump(test_case)
 
         base: Dict[str, Any] = {
+            **self._shared_base,
             "run_id": run_id,
             "namespace": namespace,
             "target_namespace": target_namespace,
-            "step": step.model_dump(),
-            "catalog": catalog_config.model_dump() if catalog_config else None,
-            "engine": engine_config.model_dump() if engine_config else None,
-            "storage": framework.storage.model_dump(),
-            "now_utc": datetime.utcnow().isoformat(),
-            "state": self.state,
+            "step": self._dump(step),
+            "catalog": self._dump(catalog_config) if catalog_config else None,
+            "engine": self._dump(engine_config) if engine_config else None,
+            "now_utc": now_utc,
             "test_case": test_case_dict,
         }
         if catalog_override_dict:
             base["catalog_override"] = catalog_override_dict
         variables = dict(base)
         if dataset_config:
-            variables["dataset"] = dataset_config.model_dump()
-        variables["target_namespace"] = target_namespace
-        variables["state"] = self.state
+            variables["dataset"] = self._dump(dataset_config)
         if engine_config:
             variables.update(engine_config.sql_variables)
         if catalog_override_dict:
@@ -121,54 +211,129 @@ class Runner:
             variables.update(step.variables)
         return base, variables
 
-    def run_plan(self, plan_name: str, namespace: str, extra_variables: Optional[Dict[str, Any]] = None) -> PlanReport:
-        framework = self.bundle.framework
-        plan = framework.plans.get(plan_name)
+    def start_plan(self, plan_name: str, namespace: str) -> PlanReport:
+        plan = self.bundle.framework.plans.get(plan_name)
         if not plan:
             raise KeyError(f"Plan '{plan_name}' not found")
 
-        run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-        report = PlanReport(plan=plan, namespace=namespace, run_id=run_id)
-        logger.info("Starting plan '%s' with namespace '%s'", plan.name, namespace)
+        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return PlanReport(plan=plan, namespace=namespace, run_id=run_id)
+
+    def iter_steps(self, report: PlanReport, extra_variables: Optional[Dict[str, Any]] = None) -> Iterator[StepReport]:
+        """Execute the plan behind ``report`` and yield each step report as it finishes.
+
+        Step reports are not appended to ``report``; callers decide whether to keep them.
+        Plans without any ``depends_on`` run strictly in order; otherwise steps whose
+        dependencies have finished run concurrently and are yielded in completion order.
+        """
+        plan = report.plan
+        logger.info("Starting plan '%s' with namespace '%s'", plan.name, report.namespace)
+        # One timestamp per plan run; kept naive so rendered now_utc values keep their format.
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+        if _runs_concurrently(plan):
+            yield from self._iter_steps_parallel(report, extra_variables, now_utc)
+            return
 
         for step in plan.steps:
-            step_report = StepReport(step=step, status="pending")
-            report.steps.append(step_report)
+            step_report = self._execute_step(report, step, extra_variables, now_utc)
+            yield step_report
+            if step_report.status == "failed" and not step.continue_on_error:
+                break
+
+    def _iter_steps_parallel(
+        self, report: PlanReport, extra_variables: Optional[Dict[str, Any]], now_utc: str
+    ) -> Iterator[StepReport]:
+        steps = report.plan.steps
+        dependencies = _resolve_dependencies(steps)
+        pending = list(steps)
+        completed: set[str] = set()
+        running: Dict[Future, PlanStepConfig] = {}
+        cancelled = False
+
+        with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="plan-step") as pool:
+            while pending or running:
+                if not cancelled:
+                    ready = [step for step in pending if dependencies[step.name] <= completed]
+                    for step in ready:
+                        pending.remove(step)
+                        running[
+                            pool.submit(self._execute_step, report, step, extra_variables, now_utc, True)
+                        ] = step
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    step_report = future.result()
+                    completed.add(step.name)
+                    if step_report.status == "failed" and not step.continue_on_error:
+                        # Let in-flight steps finish but schedule nothing new.
+                        cancelled = True
+                    yield step_report
+
+    def _execute_step(
+        self,
+        report: PlanReport,
+        step: PlanStepConfig,
+        extra_variables: Optional[Dict[str, Any]],
+        now_utc: str,
+        snapshot_state: bool = False,
+    ) -> StepReport:
+        framework = self.bundle.framework
+        step_report = StepReport(step=step, status="pending")
 
-            try:
-                test_case = framework.test_cases.get(step.test_case)
-                if not test_case:
-                    raise KeyError(f"Test case '{step.test_case}' not defined")
+        try:
+            test_case = framework.test_cases.get(step.test_case)
+            if not test_case:
+                raise KeyError(f"Test case '{step.test_case}' not defined")
 
+            with self._factory_lock:
                 adapter = self.factory.get(step.engine, step.catalog)
 
-                base_context, template_variables = self._base_variables(namespace, run_id, step, test_case)
-                if extra_variables:
-                    template_variables.update(extra_variables)
+            base_context, template_variables = self._base_variables(
+                report.namespace, report.run_id, step, test_case, now_utc
+            )
+            if extra_variables:
+                template_variables.update(extra_variables)
+            if snapshot_state:
+                # Concurrent steps write to self.state; render from a consistent copy.
+                with self._state_lock:
+                    state_snapshot = dict(self.state)
+                base_context["state"] = state_snapshot
+                if template_variables.get("state") is self.state:
+                    template_variables["state"] = state_snapshot
 
+            sql_path = test_case.resolve_script(step.engine, step.catalog)
+            with self._adapter_lock(step.engine, step.catalog):
                 adapter.configure(base_context)
-
-                sql_path = test_case.resolve_script(step.engine, step.catalog)
                 execution = adapter.run(step.name, sql_path, template_variables)
-                step_report.execution = execution
+            step_report.execution = execution
 
-                validations = list(test_case.validations) + list(step.validations)
-                if validations:
+            validations = list(test_case.validations) + list(step.validations)
+            if validations:
+                with self._state_lock:
                     outcomes = apply_validations(validations, execution, template_variables, self.state)
-                    step_report.validations.extend(outcomes)
-                step_report.status = "passed"
-            except ValidationError as exc:
-                logger.error("Validation failed on step '%s': %s", step.name, exc)
-                step_report.status = "failed"
-                step_report.error = str(exc)
-                if not step.continue_on_error:
-                    break
-            except Exception as exc:  # noqa: BLE001
-                logger.exception("Error executing step '%s'", step.name)
-                step_report.status = "failed"
-                step_report.error = str(exc)
-                if not step.continue_on_error:
-                    break
+                step_report.validations.extend(outcomes)
+            step_report.status = "passed"
+        except ValidationError as exc:
+            logger.error("Validation failed on step '%s': %s", step.name, exc)
+            step_report.status = "failed"
+            step_report.error = str(exc)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Error executing step '%s'", step.name)
+            step_report.status = "failed"
+            step_report.error = str(exc)
+        return step_report
+
+    def run_plan(self, plan_name: str, namespace: str, extra_variables: Optional[Dict[str, Any]] = None) -> PlanReport:
+        report = self.start_plan(plan_name, namespace)
+        for step_report in self.iter_steps(report, extra_variables):
+            report.steps.append(step_report)
+        if _runs_concurrently(report.plan):
+            # Concurrent plans finish out of order; keep the report in plan order.
+            position = {id(step): index for index, step in enumerate(report.plan.steps)}
+            report.steps.sort(key=lambda step_report: position[id(step_report.step)])
 
-        logger.info("Plan '%s' completed with status %s", plan.name, report.status)
+        logger.info("Plan '%s' completed with status %s", report.plan.name, report.status)
         return report
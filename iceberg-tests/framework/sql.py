@@ -1,34 +1,157 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import Any, Iterable, List, Mapping
 
 import sqlparse
-from jinja2 import BaseLoader, Environment, StrictUndefined
+from jinja2 import BaseLoader, Environment, StrictUndefined, Template, meta
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+_STATEMENT_CACHE_SIZE = 256
+_STATEMENT_CACHE: "OrderedDict[tuple[str, int, str], tuple[str, ...]]" = OrderedDict()
+# Concurrent plan steps render scripts from several threads.
+_STATEMENT_CACHE_LOCK = threading.Lock()
 
 _env = Environment(loader=BaseLoader(), autoescape=False, undefined=StrictUndefined, trim_blocks=True, lstrip_blocks=True)
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_template(template_text: str) -> Template:
+    return _env.from_string(template_text)
+
+
+def needs_rendering(text: str) -> bool:
+    """Return False when rendering ``text`` would return it unchanged."""
+    # Without any Jinja delimiter the render is the identity (Jinja only drops a trailing newline).
+    return "{" in text or text.endswith("\n")
+
+
 def render_sql_template(template_text: str, variables: dict[str, Any]) -> str:
-    template = _env.from_string(template_text)
-    return template.render(**variables)
+    if not needs_rendering(template_text):
+        return template_text
+    return _compile_template(template_text).render(**variables)
 
 
-def load_sql_script(base_path: Path, relative_path: str) -> str:
+def _resolve_script_path(base_path: Path, relative_path: str) -> Path:
     script_path = (base_path / relative_path).resolve()
     if not script_path.exists():
         raise FileNotFoundError(f"SQL script not found: {script_path}")
-    return script_path.read_text()
+    return script_path
 
 
-def split_statements(sql_text: str) -> List[str]:
-    fragments: Iterable[str] = sqlparse.split(sql_text)
-    statements = [fragment.strip() for fragment in fragments if fragment.strip()]
+def load_sql_script(base_path: Path, relative_path: str) -> str:
+    return _resolve_script_path(base_path, relative_path).read_text()
+
+
+@functools.lru_cache(maxsize=512)
+def _load_and_compile(script_path: str, mtime_ns: int) -> tuple[Template, tuple[str, ...]]:
+    """Compile a script and list the top-level variables it references."""
+    # mtime is part of the cache key so edited scripts are re-read and recompiled.
+    ast = _env.parse(Path(script_path).read_text())
+    return _env.from_string(ast), tuple(sorted(meta.find_undeclared_variables(ast)))
+
+
+# Quoted strings/identifiers, comments, statement terminators and plain SQL runs.
+_SQL_TOKEN_RE = re.compile(
+    r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|--[^\r\n]*|/\*.*?\*/|;|[^;'"`\-/]+|[-/]""",
+    re.DOTALL,
+)
+# Like sqlparse, keep comments that follow the terminator on its line with the statement
+# ("--+" optimizer hints start the next statement instead).
+_TRAILING_COMMENT_RE = re.compile(r"(?:[ \t]+|--(?!\+)[^\r\n]*(?:\r\n|\r|\n)?)*")
+_TERMINATOR_RE = re.compile(";" + _TRAILING_COMMENT_RE.pattern + r"\Z")
+# Procedural blocks and dollar-quoted bodies contain semicolons that do not end a statement.
+# sqlparse also folds a comment opener into a preceding operator run (e.g. "/--", "-/*")
+# and treats "#" as a comment, so those texts keep its exact tokenization.
+_AMBIGUOUS_RE = re.compile(r"\$\$|#|[+/@%^&|](?:-|/\*)|-/\*|\b(?:BEGIN|DECLARE)\b", re.IGNORECASE)
+
+
+def _fast_split(sql_text: str) -> list[str] | None:
+    """Split on top-level semicolons; return None when the text needs sqlparse."""
+    if _AMBIGUOUS_RE.search(sql_text):
+        return None
+    statements: list[str] = []
+    start = position = 0
+    for match in _SQL_TOKEN_RE.finditer(sql_text):
+        if match.start() != position:
+            # Unterminated quote or comment; let sqlparse decide.
+            return None
+        position = match.end()
+        if match.group() == ";":
+            end = _TRAILING_COMMENT_RE.match(sql_text, position).end()
+            statements.append(sql_text[start:end])
+            start = end
+    if position != len(sql_text):
+        return None
+    statements.append(sql_text[start:])
     return statements
 
 
-def render_sql_statements(base_path: Path, relative_path: str, variables: dict[str, Any]) -> List[str]:
-    template_text = load_sql_script(base_path, relative_path)
-    rendered = render_sql_template(template_text, variables)
-    return split_statements(rendered)
+@functools.lru_cache(maxsize=512)
+def _split_cached(sql_text: str) -> tuple[str, ...]:
+    fragments: Iterable[str] | None = _fast_split(sql_text)
+    if fragments is None:
+        fragments = sqlparse.split(sql_text)
+    return tuple(fragment.strip() for fragment in fragments if fragment.strip())
+
+
+def split_statements(sql_text: str) -> List[str]:
+    return list(_split_cached(sql_text))
+
+
+def strip_statement_terminator(statement: str) -> str:
+    """Drop a split statement's trailing ';' and any comment attached after it."""
+    return _TERMINATOR_RE.sub("", statement.rstrip()).rstrip()
+
+
+def _variables_digest(variables: Mapping[str, Any], referenced: Iterable[str]) -> str | None:
+    # Only the names the template reads can change its output, so the rest (notably
+    # the accumulated state) stays out of the key.
+    used = {name: variables[name] for name in referenced if name in variables}
+    try:
+        if orjson is not None:
+            canonical = orjson.dumps(used, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            canonical = json.dumps(used, sort_keys=True).encode()
+    except (TypeError, ValueError):
+        # Values without a canonical JSON form (or unsortable keys) bypass the cache
+        # rather than risk two objects sharing a key through their str().
+        return None
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def render_sql_statements(base_path: Path, relative_path: str, variables: Mapping[str, Any]) -> List[str]:
+    script_path = _resolve_script_path(base_path, relative_path)
+    path_key = str(script_path)
+    mtime_ns = script_path.stat().st_mtime_ns
+
+    template, referenced = _load_and_compile(path_key, mtime_ns)
+    digest = _variables_digest(variables, referenced)
+    cache_key = (path_key, mtime_ns, digest) if digest is not None else None
+    if cache_key is not None:
+        with _STATEMENT_CACHE_LOCK:
+            cached = _STATEMENT_CACHE.get(cache_key)
+            if cached is not None:
+                _STATEMENT_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            return list(cached)
+
+    # Passing the mapping positionally lets Jinja build its context with a single copy.
+    statements = _split_cached(template.render(variables))
+    if cache_key is not None:
+        with _STATEMENT_CACHE_LOCK:
+            _STATEMENT_CACHE[cache_key] = statements
+            if len(_STATEMENT_CACHE) > _STATEMENT_CACHE_SIZE:
+                _STATEMENT_CACHE.popitem(last=False)
+    return list(statements)
@@ -1,10 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from .engines.base import ExecutionResult, StatementResult
-from .sql import render_sql_template
+from .sql import needs_rendering, render_sql_template
+
+
+# Candidate count columns in priority order; Snowflake reports unquoted aliases upper-cased.
+_COUNT_KEYS = (
+    "row_count",
+    "count",
+    "count(1)",
+    "count(*)",
+    "cnt",
+    "ROW_COUNT",
+    "COUNT",
+    "COUNT(1)",
+    "COUNT(*)",
+    "CNT",
+)
+_COUNT_KEY_SET = frozenset(_COUNT_KEYS)
 
 
 class ValidationError(Exception):
@@ -18,13 +34,21 @@ class ValidationOutcome:
     details: str = ""
 
 
-def _render_value(value: Any, variables: Dict[str, Any]) -> Any:
+def _render_value(value: Any, variables: Dict[str, Any], rendered: Optional[Dict[str, str]] = None) -> Any:
     if isinstance(value, str):
-        return render_sql_template(value, variables)
+        if not needs_rendering(value):
+            return value
+        if rendered is None:
+            return render_sql_template(value, variables)
+        # Variables are fixed for one apply_validations call, so each template renders once.
+        result = rendered.get(value)
+        if result is None:
+            result = rendered[value] = render_sql_template(value, variables)
+        return result
     if isinstance(value, list):
-        return [_render_value(v, variables) for v in value]
+        return [_render_value(v, variables, rendered) for v in value]
     if isinstance(value, dict):
-        return {k: _render_value(v, variables) for k, v in value.items()}
+        return {k: _render_value(v, variables, rendered) for k, v in value.items()}
     return value
 
 
@@ -34,6 +58,63 @@ def _get_statement(result: ExecutionResult, index: int) -> Any:
     return result.statements[index]
 
 
+def _statement_for(validation: Dict[str, Any], result: ExecutionResult) -> StatementResult:
+    return _get_statement(result, validation.get("statement_index", -1))
+
+
+def _check_rowcount_equals(validation, result, variables, state, rendered) -> None:
+    statement = _statement_for(validation, result)
+    expected = int(_render_value(validation.get("expected"), variables, rendered))
+    actual = _derive_rowcount(statement)
+    if actual != expected:
+        raise ValidationError(f"Rowcount mismatch: expected={expected} actual={actual}")
+
+
+def _check_rowcount_at_least(validation, result, variables, state, rendered) -> None:
+    statement = _statement_for(validation, result)
+    threshold = int(_render_value(validation.get("threshold"), variables, rendered))
+    actual = _derive_rowcount(statement) or 0
+    if actual < threshold:
+        raise ValidationError(f"Rowcount {actual} below threshold {threshold}")
+
+
+def _store_rows_as(validation, result, variables, state, rendered) -> None:
+    statement = _statement_for(validation, result)
+    key = validation.get("name")
+    if not key:
+        raise ValidationError("store_rows_as validation missing 'name'")
+    state[key] = statement.rows
+
+
+def _store_rowcount_as(validation, result, variables, state, rendered) -> None:
+    statement = _statement_for(validation, result)
+    key = validation.get("name")
+    if not key:
+        raise ValidationError("store_rowcount_as validation missing 'name'")
+    state[key] = _derive_rowcount(statement)
+
+
+def _compare_rows_with_state(validation, result, variables, state, rendered) -> None:
+    statement = _statement_for(validation, result)
+    previous = state.get(validation.get("name"))
+    if isinstance(previous, list) and isinstance(statement.rows, list) and len(previous) != len(statement.rows):
+        raise ValidationError(
+            f"Result row count differs from stored state: expected={len(previous)} actual={len(statement.rows)}"
+        )
+    if previous != statement.rows:
+        raise ValidationError("Result rows differ from stored state")
+
+
+# Each handler raises ValidationError on failure and returns None on success.
+_HANDLERS: Dict[str, Callable[..., None]] = {
+    "rowcount_equals": _check_rowcount_equals,
+    "rowcount_at_least": _check_rowcount_at_least,
+    "store_rows_as": _store_rows_as,
+    "store_rowcount_as": _store_rowcount_as,
+    "compare_rows_with_state": _compare_rows_with_state,
+}
+
+
 def apply_validations(
     validations: List[Dict[str, Any]],
     execution_result: ExecutionResult,
@@ -41,56 +122,32 @@ def apply_validations(
     state: Dict[str, Any],
 ) -> List[ValidationOutcome]:
     outcomes: List[ValidationOutcome] = []
+    rendered: Dict[str, str] = {}
+    # Declared order is kept so outcomes and store_* side effects match the config;
+    # compare_rows_with_state checks lengths before comparing whole row sets.
     for validation in validations:
         vtype = validation.get("type")
         try:
-            if vtype == "rowcount_equals":
-                statement = _get_statement(execution_result, validation.get("statement_index", -1))
-                expected = int(_render_value(validation.get("expected"), variables))
-                actual = _derive_rowcount(statement)
-                if actual != expected:
-                    raise ValidationError(f"Rowcount mismatch: expected={expected} actual={actual}")
-                outcomes.append(ValidationOutcome(validation, True))
-            elif vtype == "rowcount_at_least":
-                statement = _get_statement(execution_result, validation.get("statement_index", -1))
-                threshold = int(_render_value(validation.get("threshold"), variables))
-                actual = _derive_rowcount(statement) or 0
-                if actual < threshold:
-                    raise ValidationError(f"Rowcount {actual} below threshold {threshold}")
-                outcomes.append(ValidationOutcome(validation, True))
-            elif vtype == "store_rows_as":
-                statement = _get_statement(execution_result, validation.get("statement_index", -1))
-                key = validation.get("name")
-                if not key:
-                    raise ValidationError("store_rows_as validation missing 'name'")
-                state[key] = statement.rows
-                outcomes.append(ValidationOutcome(validation, True))
-            elif vtype == "store_rowcount_as":
-                statement = _get_statement(execution_result, validation.get("statement_index", -1))
-                key = validation.get("name")
-                if not key:
-                    raise ValidationError("store_rowcount_as validation missing 'name'")
-                state[key] = _derive_rowcount(statement)
-                outcomes.append(ValidationOutcome(validation, True))
-            elif vtype == "compare_rows_with_state":
-                statement = _get_statement(execution_result, validation.get("statement_index", -1))
-                key = validation.get("name")
-                previous = state.get(key)
-                if previous != statement.rows:
-                    raise ValidationError("Result rows differ from stored state")
-                outcomes.append(ValidationOutcome(validation, True))
-            else:
+            handler = _HANDLERS.get(vtype)
+            if handler is None:
                 raise ValidationError(f"Unknown validation type '{vtype}'")
+            handler(validation, execution_result, variables, state, rendered)
+            outcomes.append(ValidationOutcome(validation, True))
         except ValidationError as exc:
             outcomes.append(ValidationOutcome(validation, False, str(exc)))
             raise
     return outcomes
+
+
 def _derive_rowcount(statement: StatementResult) -> int | None:
     if statement.rows:
         first_row = statement.rows[0]
         if isinstance(first_row, dict):
-            for key in ("row_count", "count", "count(1)", "count(*)"):
-                if key in first_row:
+            present = _COUNT_KEY_SET & first_row.keys()
+            if present:
+                for key in _COUNT_KEYS:
+                    if key not in present:
+                        continue
                     value = first_row[key]
                     if value is None:
                         continue
@@ -99,10 +156,7 @@ def _derive_rowcount(statement: StatementResult) -> int | None:
                     except (TypeError, ValueError):
                         pass
             if len(first_row) == 1:
-                try:
-                    value = next(iter(first_row.values()))
-                except StopIteration:
-                    value = None
+                value = next(iter(first_row.values()))
                 if value is not None:
                     try:
                         return int(value)
@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("snowflake.connector")
+
+from framework.engines.snowflake import SnowflakeEngineAdapter, _PooledConnection
+
+
+class _RecordingCursor:
+    def __init__(self) -> None:
+        self.statements = []
+
+    def execute(self, statement: str) -> None:
+        self.statements.append(statement)
+
+
+def _adapter(database, schema, pooled):
+    adapter = SnowflakeEngineAdapter.__new__(SnowflakeEngineAdapter)
+    adapter.database = database
+    adapter.schema = schema
+    adapter._pooled = pooled
+    return adapter
+
+
+def test_scope_switch_keeps_lowercase_database_case_insensitive() -> None:
+    pooled = _PooledConnection(ctx=None)
+    first = _adapter("interop_db", "open_catalog", pooled)
+    second = _adapter("interop_db", "unity_catalog", pooled)
+    pooled.owner = first
+    cursor = _RecordingCursor()
+
+    second._activate_scope(cursor)
+    second._activate_scope(cursor)
+
+    assert cursor.statements == ["USE SCHEMA interop_db.unity_catalog"]
+    assert pooled.owner is second
+
+
+def test_scope_switch_database_only() -> None:
+    pooled = _PooledConnection(ctx=None)
+    adapter = _adapter("interop_db", None, pooled)
+    cursor = _RecordingCursor()
+
+    adapter._activate_scope(cursor)
+
+    assert cursor.statements == ["USE DATABASE interop_db"]
@@ -1,27 +1,44 @@
 import argparse
 import json
 import os
+import re
 import sys
+import threading
 import time
+from functools import lru_cache
+from graphlib import TopologicalSorter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from string import Template
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from string import Formatter, Template
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 
 SUCCESS_CODES: Tuple[int, ...] = (200, 201, 202, 204)
+_READ_METHODS = frozenset({"GET", "HEAD"})
+MAX_CONCURRENT_REQUESTS = 16
+_EXCERPT_READ_BYTES = 4096
+_WHITESPACE_RE = re.compile(r"\s+")
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class ConfigurationError(RuntimeError):
     """Raised when required configuration is missing."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HttpTest:
     name: str
     method: str
@@ -33,6 +50,40 @@ class HttpTest:
     expected_status_codes: Tuple[int, ...] = ()
     capture: Optional[Callable[[Dict[str, Any], Response], None]] = None
     description: str = ""
+    cleanup_resource: Optional[str] = None
+    cleanup_depends_on: Optional[str] = None
+    base_url: str = field(default="", repr=False, compare=False)
+    _path_fields: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _success_set: FrozenSet[int] = field(init=False, repr=False, compare=False)
+    _expected_set: FrozenSet[int] = field(init=False, repr=False, compare=False)
+    _has_json: bool = field(init=False, repr=False, compare=False)
+    _has_params: bool = field(init=False, repr=False, compare=False)
+    _has_capture: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        names = (
+            field_name.split(".", 1)[0].split("[", 1)[0]
+            for _, field_name, _, _ in Formatter().parse(self.path_template)
+            if field_name
+        )
+        set_attr = object.__setattr__
+        set_attr(self, "_path_fields", tuple(dict.fromkeys(names)))
+        set_attr(self, "_success_set", frozenset(self.success_codes))
+        set_attr(self, "_expected_set", frozenset(self.expected_status_codes))
+        set_attr(self, "_has_json", self.json_builder is not None)
+        set_attr(self, "_has_params", self.params_builder is not None)
+        set_attr(self, "_has_capture", self.capture is not None)
+
+    def format_path(self, context: Dict[str, Any]) -> str:
+        if not self._path_fields:
+            return self.path_template
+        return self.path_template.format_map({name: context[name] for name in self._path_fields})
+
+    def bind(self, tester: "PolarisApiTester") -> "HttpTest":
+        base_url = tester.base_urls[self.base]
+        if base_url == self.base_url:
+            return self
+        return replace(self, base_url=base_url)
 
     def resolve_json(self, context: Dict[str, Any]) -> Any:
         if callable(self.json_builder):
@@ -63,18 +114,37 @@ class PolarisApiTester:
         self.client_id = client_id
         self.client_secret = client_secret
         self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=64,
+                # Only connection failures are retried: status codes are what the suite
+                # reports, and replaying versioned PUTs would surface spurious 409s.
+                max_retries=Retry(
+                    total=3,
+                    connect=3,
+                    read=0,
+                    status=0,
+                    backoff_factor=0.2,
+                    allowed_methods=frozenset({"GET", "HEAD"}),
+                ),
+            ),
+        )
         self.base_urls = {
             "management": f"https://{self.account}/api/management/v1",
             "catalog": f"https://{self.account}/api/catalog",
         }
         self._token: Optional[str] = None
+        self._token_lock = threading.Lock()
 
     def authenticate(self) -> None:
         token_url = f"{self.base_urls['catalog']}/v1/oauth/tokens"
-        response = requests.post(
+        response = self.session.post(
             token_url,
             data={"grant_type": "client_credentials", "scope": self.scope},
             auth=HTTPBasicAuth(self.client_id, self.client_secret),
+            timeout=30,
         )
         try:
             response.raise_for_status()
@@ -82,15 +152,21 @@ class PolarisApiTester:
             raise RuntimeError(
                 f"Failed to obtain access token ({response.status_code}): {response.text}"
             ) from exc
-        token = response.json().get("access_token")
+        token = _response_json(response).get("access_token")
         if not token:
             raise RuntimeError("OAuth response did not include an access_token")
         self._token = token
         self.session.headers.update({"Authorization": f"Bearer {token}"})
 
+    def close(self) -> None:
+        self.session.close()
+
     def _ensure_token(self) -> None:
-        if not self._token:
-            self.authenticate()
+        if self._token:
+            return
+        with self._token_lock:
+            if not self._token:
+                self.authenticate()
 
     def request(
         self,
@@ -100,12 +176,28 @@ class PolarisApiTester:
         *,
         json_body: Any = None,
         params: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        return self.send(method, self.base_urls[base] + path, json_body=json_body, params=params)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Any = None,
+        params: Optional[Dict[str, Any]] = None,
     ) -> Response:
         self._ensure_token()
-        base_url = self.base_urls[base]
-        url = f"{base_url}{path}"
-        response = self.session.request(method, url, json=json_body, params=params, timeout=30)
-        return response
+        if json_body is not None and orjson is not None:
+            return self.session.request(
+                method,
+                url,
+                data=orjson.dumps(json_body),
+                params=params,
+                headers=_JSON_HEADERS,
+                timeout=30,
+            )
+        return self.session.request(method, url, json=json_body, params=params, timeout=30)
 
 
 class TestSuite:
@@ -113,74 +205,174 @@ class TestSuite:
         self.tester = tester
         self.context = context
         self.results: List[TestResult] = []
+        self._totals = {"total": 0, "passed": 0, "failed": 0, "expected": 0}
+        self._results_lock = threading.Lock()
+
+    def run(self, tests: Iterable[HttpTest], context: Optional[Dict[str, Any]] = None) -> List[TestResult]:
+        return self.run_batches(_concurrent_groups(tests), context)
+
+    def run_batches(
+        self, batches: Iterable[List[HttpTest]], context: Optional[Dict[str, Any]] = None
+    ) -> List[TestResult]:
+        """Run each batch concurrently, one batch after another, and return the new results.
+
+        ``context`` defaults to the suite's own; phases that run side by side pass
+        their own copy so captures do not race on a shared dict.
+        """
+        if context is None:
+            context = self.context
+        results: List[TestResult] = []
+        for group in batches:
+            group = [test.bind(self.tester) for test in group]
+            if len(group) == 1:
+                test = group[0]
+                results.append(self._record(test, self._send(test, self._prepare(test, context)), context))
+                continue
+            prepared = [self._prepare(test, context) for test in group]
+            outcomes: List[Any] = [None] * len(group)
+            with ThreadPoolExecutor(max_workers=min(len(group), MAX_CONCURRENT_REQUESTS)) as executor:
+                futures = {
+                    executor.submit(self._send, test, request): index
+                    for index, (test, request) in enumerate(zip(group, prepared))
+                }
+                for future in as_completed(futures):
+                    outcomes[futures[future]] = future.result()
+            for test, outcome in zip(group, outcomes):
+                results.append(self._record(test, outcome, context))
+        return results
+
+    def _prepare(self, test: HttpTest, context: Dict[str, Any]) -> Tuple[str, Any, Optional[Dict[str, Any]]]:
+        url = test.base_url + test.format_path(context)
+        json_body = test.resolve_json(context) if test._has_json else None
+        params = test.resolve_params(context) if test._has_params else None
+        return url, json_body, params
+
+    def _send(
+        self, test: HttpTest, prepared: Tuple[str, Any, Optional[Dict[str, Any]]]
+    ) -> Tuple[Optional[Response], Optional[str], float]:
+        url, json_body, params = prepared
+        start = time.perf_counter()
+        try:
+            response = self.tester.send(test.method, url, json_body=json_body, params=params)
+        except Exception as exc:  # noqa: BLE001
+            return None, str(exc), time.perf_counter() - start
+        return response, None, time.perf_counter() - start
 
-    def run(self, tests: Iterable[HttpTest]) -> None:
-        for test in tests:
-            path = test.path_template.format(**self.context)
-            json_body = test.resolve_json(self.context)
-            params = test.resolve_params(self.context)
-            start = time.time()
-            error = None
-            body_excerpt = None
-            status_code = None
-            ok = False
-            expected = False
+    def _record(
+        self,
+        test: HttpTest,
+        outcome: Tuple[Optional[Response], Optional[str], float],
+        context: Dict[str, Any],
+    ) -> TestResult:
+        response, error, duration = outcome
+        body_excerpt = None
+        status_code = None
+        ok = False
+        expected = False
+        if response is not None:
             try:
-                response = self.tester.request(
-                    test.method,
-                    test.base,
-                    path,
-                    json_body=json_body,
-                    params=params,
-                )
                 status_code = response.status_code
-                if status_code in test.success_codes:
+                if status_code in test._success_set:
                     ok = True
-                elif status_code in test.expected_status_codes:
+                elif status_code in test._expected_set:
                     ok = True
                     expected = True
                 if response.content:
                     body_excerpt = _safe_excerpt(response)
-                if test.capture is not None:
-                    test.capture(self.context, response)
+                if test._has_capture:
+                    test.capture(context, response)
             except Exception as exc:  # noqa: BLE001
                 error = str(exc)
-            finally:
-                duration = time.time() - start
-                if error and not body_excerpt:
-                    body_excerpt = error
-                self.results.append(
-                    TestResult(
-                        test=test,
-                        status_code=status_code,
-                        ok=ok,
-                        duration=duration,
-                        error=error,
-                        body_excerpt=body_excerpt,
-                        expected=expected,
-                    )
-                )
+        if error and not body_excerpt:
+            body_excerpt = error
+        result = TestResult(
+            test=test,
+            status_code=status_code,
+            ok=ok,
+            duration=duration,
+            error=error,
+            body_excerpt=body_excerpt,
+            expected=expected,
+        )
+        with self._results_lock:
+            totals = self._totals
+            totals["total"] += 1
+            totals["passed" if ok else "failed"] += 1
+            if expected:
+                totals["expected"] += 1
+            self.results.append(result)
+        return result
 
     def summarize(self) -> Dict[str, Any]:
-        passed = [r for r in self.results if r.ok]
-        failed = [r for r in self.results if not r.ok]
-        expected = [r for r in self.results if r.expected]
-        return {
-            "total": len(self.results),
-            "passed": len(passed),
-            "failed": len(failed),
-            "expected": len(expected),
-        }
+        with self._results_lock:
+            return dict(self._totals)
+
+
+def _concurrent_groups(tests: Iterable[HttpTest]) -> List[List[HttpTest]]:
+    """Split tests into batches that can be in flight at the same time.
+
+    Only GET/HEAD probes are batched. A test with a capture closes its batch so
+    that later paths and bodies see whatever it wrote into the context; writes
+    always run on their own, in order.
+    """
+    groups: List[List[HttpTest]] = []
+    current: List[HttpTest] = []
+    for test in tests:
+        if test.method not in _READ_METHODS:
+            if current:
+                groups.append(current)
+                current = []
+            groups.append([test])
+            continue
+        current.append(test)
+        if test._has_capture:
+            groups.append(current)
+            current = []
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _response_json(response: Response) -> Any:
+    return _json_loads(response.content)
+
+
+def _cleanup_batches(tests: Iterable[HttpTest]) -> List[List[HttpTest]]:
+    """Order cleanup calls so children are deleted before their parent resource.
+
+    Each test names the resource it deletes and, optionally, the parent it lives
+    in; siblings with no ordering between them share a batch.
+    """
+    ordered = list(tests)
+    by_resource: Dict[str, List[HttpTest]] = {}
+    sorter: TopologicalSorter = TopologicalSorter()
+    for test in ordered:
+        resource = test.cleanup_resource or test.name
+        by_resource.setdefault(resource, []).append(test)
+        sorter.add(resource)
+        if test.cleanup_depends_on:
+            sorter.add(test.cleanup_depends_on, resource)
+    position = {id(test): index for index, test in enumerate(ordered)}
+    batches: List[List[HttpTest]] = []
+    sorter.prepare()
+    while sorter.is_active():
+        ready = sorter.get_ready()
+        batch = [test for resource in ready for test in by_resource.get(resource, ())]
+        if batch:
+            batches.append(sorted(batch, key=lambda test: position[id(test)]))
+        sorter.done(*ready)
+    return batches
 
 
 def _safe_excerpt(response: Response, limit: int = 500) -> str:
-    try:
-        data = response.json()
-        text = json.dumps(data, separators=(",", ":"))
-    except ValueError:
-        text = response.text
-    text = " ".join(text.split())
-    return text[:limit]
+    raw = response.content[:_EXCERPT_READ_BYTES].decode(response.encoding or "utf-8", errors="replace")
+    return _WHITESPACE_RE.sub(" ", raw).strip()[:limit]
 
 
 def _append_location_suffix(location: str, suffix: str) -> str:
@@ -212,10 +404,15 @@ def _template_variables(context: Dict[str, Any], extra: Optional[Dict[str, Any]]
     return {key: str(value) for key, value in vars_map.items() if value is not None}
 
 
+@lru_cache(maxsize=16)
+def _compile_template(template_text: str) -> Template:
+    return Template(template_text)
+
+
 def _render_json_template(template_text: str, variables: Dict[str, str]) -> Dict[str, Any]:
     try:
-        rendered = Template(template_text).safe_substitute(variables)
-        payload = json.loads(rendered)
+        rendered = _compile_template(template_text).safe_substitute(variables)
+        payload = _json_loads(rendered)
     except Exception as exc:  # noqa: BLE001
         raise ValueError(f"template rendering failed: {exc}") from exc
     if not isinstance(payload, dict):
@@ -223,16 +420,26 @@ def _render_json_template(template_text: str, variables: Dict[str, str]) -> Dict
     return payload
 
 
+@lru_cache(maxsize=8)
+def _load_spec(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text()
+
+
+def _read_spec(path: str) -> str:
+    return _load_spec(path, os.stat(path).st_mtime_ns)
+
+
 def load_configuration() -> Tuple[str, str, str, str]:
-    account = os.environ.get("OC_ACCOUNT")
-    scope = os.environ.get("OC_SCOPE")
-    client_id = os.environ.get("OC_CLIENT_ID")
-    client_secret = os.environ.get("OC_CLIENT_SECRET")
+    env = os.environ
+    account = env.get("OC_ACCOUNT")
+    scope = env.get("OC_SCOPE")
+    client_id = env.get("OC_CLIENT_ID")
+    client_secret = env.get("OC_CLIENT_SECRET")
     if not account or not scope:
         raise ConfigurationError("OC_ACCOUNT and OC_SCOPE must be set")
 
     if not client_id or not client_secret:
-        cred = os.environ.get("OC_CRED")
+        cred = env.get("OC_CRED")
         if cred and ":" in cred:
             client_id, client_secret = cred.split(":", 1)
 
@@ -244,63 +451,65 @@ def load_configuration() -> Tuple[str, str, str, str]:
     return account, scope, client_id, client_secret
 
 
-def build_management_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
-    catalog = ctx.get("catalog")
+def _capture_catalog_details(context: Dict[str, Any], response: Response) -> None:
+    try:
+        payload = _response_json(response)
+    except ValueError:
+        return
+    if not isinstance(payload, dict):
+        return
+    entity_version = payload.get("entityVersion") or payload.get("entity-version")
+    if entity_version is not None:
+        context["catalog_entity_version"] = entity_version
+    properties = payload.get("properties")
+    if isinstance(properties, dict):
+        context["catalog_properties"] = properties
+        default_base = properties.get("default-base-location")
+        if default_base:
+            context["default_base_location"] = default_base
+    storage_config = payload.get("storageConfigInfo") or payload.get("storage-config-info")
+    if isinstance(storage_config, dict):
+        context["catalog_storage_config"] = storage_config
+
+
+_MANAGEMENT_TESTS: Tuple[HttpTest, ...] = (
+    HttpTest(
+        name="List catalogs",
+        method="GET",
+        base="management",
+        path_template="/catalogs",
+        description="Enumerate catalogs available to the principal.",
+        expected_status_codes=(403,),
+    ),
+    HttpTest(
+        name="Describe catalog",
+        method="GET",
+        base="management",
+        path_template="/catalogs/{catalog}",
+        description="Fetch metadata for the target catalog.",
+        capture=_capture_catalog_details,
+    ),
+    HttpTest(
+        name="List catalog roles",
+        method="GET",
+        base="management",
+        path_template="/catalogs/{catalog}/catalog-roles",
+        description="Enumerate catalog roles in the catalog.",
+        expected_status_codes=(403,),
+    ),
+    HttpTest(
+        name="List principal roles",
+        method="GET",
+        base="management",
+        path_template="/principal-roles",
+        description="Inspect principal roles available to the principal.",
+        expected_status_codes=(403,),
+    ),
+)
 
-    def capture_catalog_details(context: Dict[str, Any], response: Response) -> None:
-        try:
-            payload = response.json()
-        except ValueError:
-            return
-        if not isinstance(payload, dict):
-            return
-        entity_version = payload.get("entityVersion") or payload.get("entity-version")
-        if entity_version is not None:
-            context["catalog_entity_version"] = entity_version
-        properties = payload.get("properties")
-        if isinstance(properties, dict):
-            context["catalog_properties"] = properties
-            default_base = properties.get("default-base-location")
-            if default_base:
-                context["default_base_location"] = default_base
-        storage_config = payload.get("storageConfigInfo") or payload.get("storage-config-info")
-        if isinstance(storage_config, dict):
-            context["catalog_storage_config"] = storage_config
 
-    return [
-        HttpTest(
-            name="List catalogs",
-            method="GET",
-            base="management",
-            path_template="/catalogs",
-            description="Enumerate catalogs available to the principal.",
-            expected_status_codes=(403,),
-        ),
-        HttpTest(
-            name="Describe catalog",
-            method="GET",
-            base="management",
-            path_template="/catalogs/{catalog}",
-            description="Fetch metadata for the target catalog.",
-            capture=capture_catalog_details,
-        ),
-        HttpTest(
-            name="List catalog roles",
-            method="GET",
-            base="management",
-            path_template="/catalogs/{catalog}/catalog-roles",
-            description="Enumerate catalog roles in the catalog.",
-            expected_status_codes=(403,),
-        ),
-        HttpTest(
-            name="List principal roles",
-            method="GET",
-            base="management",
-            path_template="/principal-roles",
-            description="Inspect principal roles available to the principal.",
-            expected_status_codes=(403,),
-        ),
-    ]
+def build_management_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
+    return list(_MANAGEMENT_TESTS)
 
 
 def build_management_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
@@ -391,7 +600,7 @@ def build_management_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
             if response.status_code not in SUCCESS_CODES:
                 return
             try:
-                payload = response.json()
+                payload = _response_json(response)
             except ValueError:
                 return
             state = context.get("catalog_update_state") or {}
@@ -467,96 +676,103 @@ def build_management_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
     return tests
 
 
-def build_catalog_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
-    def capture_config(context: Dict[str, Any], response: Response) -> None:
-        try:
-            payload = response.json()
-        except ValueError:
-            return
-        defaults = payload.get("defaults") or {}
-        base_location = defaults.get("default-base-location")
-        if base_location:
-            context.setdefault("default_base_location", base_location)
+def _capture_config(context: Dict[str, Any], response: Response) -> None:
+    try:
+        payload = _response_json(response)
+    except ValueError:
+        return
+    defaults = payload.get("defaults") or {}
+    base_location = defaults.get("default-base-location")
+    if base_location:
+        context.setdefault("default_base_location", base_location)
 
-    def capture_namespaces(context: Dict[str, Any], response: Response) -> None:
-        try:
-            payload = response.json()
-        except ValueError:
-            return
-        namespaces = [".".join(parts) for parts in payload.get("namespaces", []) if parts]
-        if namespaces and not context.get("namespace"):
-            context["namespace"] = namespaces[0]
-        context["namespaces"] = namespaces
 
-    def capture_tables(context: Dict[str, Any], response: Response) -> None:
-        try:
-            payload = response.json()
-        except ValueError:
-            return
-        identifiers = payload.get("identifiers") or []
-        if identifiers:
-            context["table"] = identifiers[0].get("name") or identifiers[0]
-        context["tables"] = identifiers
+def _capture_namespaces(context: Dict[str, Any], response: Response) -> None:
+    if context.get("namespace"):
+        return
+    try:
+        payload = _response_json(response)
+    except ValueError:
+        return
+    first = next((parts for parts in payload.get("namespaces", []) if parts), None)
+    if first:
+        context["namespace"] = ".".join(first)
 
-    return [
-        HttpTest(
-            name="Get config",
-            method="GET",
-            base="catalog",
-            path_template="/v1/config",
-            description="Check controller configuration.",
-            params_builder=lambda context: {"warehouse": context.get("warehouse")} if context.get("warehouse") else None,
-            capture=capture_config,
-        ),
-        HttpTest(
-            name="List namespaces",
-            method="GET",
-            base="catalog",
-            path_template="/v1/{catalog}/namespaces",
-            description="Enumerate namespaces within the catalog prefix.",
-            capture=capture_namespaces,
-        ),
-        HttpTest(
-            name="Describe namespace",
-            method="GET",
-            base="catalog",
-            path_template="/v1/{catalog}/namespaces/{namespace}",
-            description="Fetch namespace properties for the first discovered namespace.",
-        ),
-        HttpTest(
-            name="Namespace exists",
-            method="HEAD",
-            base="catalog",
-            path_template="/v1/{catalog}/namespaces/{namespace}",
-            description="HEAD probe to assert namespace existence.",
-        ),
-        HttpTest(
-            name="List tables",
-            method="GET",
-            base="catalog",
-            path_template="/v1/{catalog}/namespaces/{namespace}/tables",
-            description="List tables within the namespace.",
-            capture=capture_tables,
-        ),
-        HttpTest(
-            name="List views",
-            method="GET",
-            base="catalog",
-            path_template="/v1/{catalog}/namespaces/{namespace}/views",
-            description="List views within the namespace.",
-        ),
-        HttpTest(
-            name="Get applicable policies",
-            method="GET",
-            base="catalog",
-            path_template="/polaris/v1/{catalog}/applicable-policies",
-            description="Inspect policies applicable to the catalog prefix.",
-            expected_status_codes=(406,),
-        ),
-    ]
 
+def _capture_tables(context: Dict[str, Any], response: Response) -> None:
+    try:
+        payload = _response_json(response)
+    except ValueError:
+        return
+    identifiers = payload.get("identifiers") or []
+    if identifiers:
+        context["table"] = identifiers[0].get("name") or identifiers[0]
+    context["tables"] = identifiers
+
+
+_CATALOG_TESTS: Tuple[HttpTest, ...] = (
+    HttpTest(
+        name="Get config",
+        method="GET",
+        base="catalog",
+        path_template="/v1/config",
+        description="Check controller configuration.",
+        params_builder=lambda context: {"warehouse": context.get("warehouse")} if context.get("warehouse") else None,
+        capture=_capture_config,
+    ),
+    HttpTest(
+        name="List namespaces",
+        method="GET",
+        base="catalog",
+        path_template="/v1/{catalog}/namespaces",
+        description="Enumerate namespaces within the catalog prefix.",
+        capture=_capture_namespaces,
+    ),
+    HttpTest(
+        name="Describe namespace",
+        method="GET",
+        base="catalog",
+        path_template="/v1/{catalog}/namespaces/{namespace}",
+        description="Fetch namespace properties for the first discovered namespace.",
+    ),
+    HttpTest(
+        name="Namespace exists",
+        method="HEAD",
+        base="catalog",
+        path_template="/v1/{catalog}/namespaces/{namespace}",
+        description="HEAD probe to assert namespace existence.",
+    ),
+    HttpTest(
+        name="List tables",
+        method="GET",
+        base="catalog",
+        path_template="/v1/{catalog}/namespaces/{namespace}/tables",
+        description="List tables within the namespace.",
+        capture=_capture_tables,
+    ),
+    HttpTest(
+        name="List views",
+        method="GET",
+        base="catalog",
+        path_template="/v1/{catalog}/namespaces/{namespace}/views",
+        description="List views within the namespace.",
+    ),
+    HttpTest(
+        name="Get applicable policies",
+        method="GET",
+        base="catalog",
+        path_template="/polaris/v1/{catalog}/applicable-policies",
+        description="Inspect policies applicable to the catalog prefix.",
+        expected_status_codes=(406,),
+    ),
+)
+
+
+def build_catalog_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
+    return list(_CATALOG_TESTS)
 
-def build_catalog_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
+
+def build_catalog_write_tests(ctx: Dict[str, Any]) -> Tuple[List[HttpTest], List[HttpTest]]:
     write_namespace = ctx.get("write_namespace")
     if not write_namespace:
         write_namespace = f"{ctx.get('catalog', 'catalog')}_codex_{int(time.time())}"
@@ -610,7 +826,7 @@ def build_catalog_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
 
     def capture_namespace(context: Dict[str, Any], response: Response) -> None:
         try:
-            payload = response.json()
+            payload = _response_json(response)
         except ValueError:
             return
         namespace = payload.get("namespace")
@@ -626,7 +842,7 @@ def build_catalog_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
         if response.status_code == 200:
             context["table_created"] = True
             try:
-                payload = response.json()
+                payload = _response_json(response)
             except ValueError:
                 return
             metadata_location = payload.get("metadata-location")
@@ -715,6 +931,8 @@ def build_catalog_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
                     path_template="/v1/{catalog}/namespaces/{write_namespace}/tables/{write_table}",
                     description="Drop the scratch table.",
                     success_codes=(204, 404),
+                    cleanup_resource="table",
+                    cleanup_depends_on="namespace",
                 )
             )
 
@@ -727,23 +945,21 @@ def build_catalog_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
                 path_template="/v1/{catalog}/namespaces/{write_namespace}",
                 description="Tear down the scratch namespace if creation succeeded.",
                 success_codes=(204, 404),
+                cleanup_resource="namespace",
             )
         )
 
-    if cleanup_tests:
-        ctx.setdefault("cleanup_tests", []).extend(cleanup_tests)
-
-    return tests
+    return tests, cleanup_tests
 
 
-def build_view_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
+def build_view_write_tests(ctx: Dict[str, Any]) -> Tuple[List[HttpTest], List[HttpTest]]:
     template_text = ctx.get("view_template_text")
     if not template_text:
-        return []
+        return [], []
 
     write_namespace = ctx.get("write_namespace")
     if not write_namespace:
-        return []
+        return [], []
 
     write_view = ctx.get("view_name_override")
     if not write_view:
@@ -781,7 +997,7 @@ def build_view_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
         if response.status_code == 200:
             context["view_created"] = True
             try:
-                payload = response.json()
+                payload = _response_json(response)
             except ValueError:
                 return
             metadata_location = payload.get("metadata-location")
@@ -832,8 +1048,9 @@ def build_view_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
         ),
     ]
 
+    cleanup_tests: List[HttpTest] = []
     if not ctx.get("keep_artifacts"):
-        ctx.setdefault("cleanup_tests", []).append(
+        cleanup_tests.append(
             HttpTest(
                 name="Drop view",
                 method="DELETE",
@@ -841,10 +1058,12 @@ def build_view_write_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
                 path_template="/v1/{catalog}/namespaces/{write_namespace}/views/{write_view}",
                 description="Drop the scratch view.",
                 success_codes=(204, 404),
+                cleanup_resource="view",
+                cleanup_depends_on="namespace",
             )
         )
 
-    return tests
+    return tests, cleanup_tests
 
 
 def build_table_metrics_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
@@ -885,8 +1104,8 @@ def build_table_metrics_tests(ctx: Dict[str, Any]) -> List[HttpTest]:
     ]
 
 
-def print_results(title: str, results: List[TestResult], verbose: bool = False) -> None:
-    print(f"\n== {title} ==")
+def format_results(title: str, results: List[TestResult], verbose: bool = False) -> List[str]:
+    lines = ["", f"== {title} =="]
     for result in results:
         status_text = result.status_code if result.status_code is not None else "ERR"
         outcome = "PASS"
@@ -898,24 +1117,26 @@ def print_results(title: str, results: List[TestResult], verbose: bool = False)
         if result.body_excerpt:
             excerpt = result.body_excerpt if verbose else result.body_excerpt[:160]
             line += f" | {excerpt}"
-        print(line)
+        lines.append(line)
+    return lines
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    env = os.environ
     parser = argparse.ArgumentParser(description="Polaris OpenCatalog REST API tester")
     parser.add_argument(
         "--catalog",
-        default=os.environ.get("OC_CATALOG", "open_snowflake"),
+        default=env.get("OC_CATALOG", "open_snowflake"),
         help="Catalog prefix (i.e. Polaris catalog name)",
     )
     parser.add_argument(
         "--namespace",
-        default=os.environ.get("OC_NAMESPACE"),
+        default=env.get("OC_NAMESPACE"),
         help="Namespace to target for namespace-scoped calls",
     )
     parser.add_argument(
         "--warehouse",
-        default=os.environ.get("OC_WAREHOUSE"),
+        default=env.get("OC_WAREHOUSE"),
         help="Warehouse identifier to supply when fetching catalog configuration",
     )
     parser.add_argument(
@@ -992,7 +1213,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     if args.table_create_spec:
         try:
-            template_text = Path(args.table_create_spec).read_text()
+            template_text = _read_spec(args.table_create_spec)
         except OSError as exc:
             print(f"Failed to read table spec file: {exc}", file=sys.stderr)
             return 3
@@ -1004,7 +1225,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     if args.view_create_spec:
         try:
-            view_text = Path(args.view_create_spec).read_text()
+            view_text = _read_spec(args.view_create_spec)
         except OSError as exc:
             print(f"Failed to read view spec file: {exc}", file=sys.stderr)
             return 3
@@ -1016,94 +1237,79 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     if args.table_metrics_spec:
         try:
-            metrics_text = Path(args.table_metrics_spec).read_text()
+            metrics_text = _read_spec(args.table_metrics_spec)
         except OSError as exc:
             print(f"Failed to read metrics spec file: {exc}", file=sys.stderr)
             return 3
         context["table_metrics_template_text"] = metrics_text
         context["table_metrics_template_path"] = args.table_metrics_spec
 
-    tester = PolarisApiTester(account, scope, client_id, client_secret)
-    suite = TestSuite(tester, context)
-
-    management_tests = build_management_tests(context)
-    suite.run(management_tests)
-    catalog_tests = build_catalog_tests(context)
-    suite.run(catalog_tests)
+    has_view_template = "view_template_text" in context
+    has_metrics_template = "table_metrics_template_text" in context
 
-    management_write_tests: List[HttpTest] = []
-    catalog_write_tests: List[HttpTest] = []
-    view_write_tests: List[HttpTest] = []
-    metrics_tests: List[HttpTest] = []
-    cleanup_tests: List[HttpTest] = []
-
-    if args.include_writes:
-        management_write_tests = build_management_write_tests(context)
-        if management_write_tests:
-            suite.run(management_write_tests)
-
-        catalog_write_tests = build_catalog_write_tests(context)
-        suite.run(catalog_write_tests)
-
-        if context.get("view_template_text"):
-            view_write_tests = build_view_write_tests(context)
-            if view_write_tests:
-                suite.run(view_write_tests)
-
-        if context.get("table_metrics_template_text"):
-            metrics_tests = build_table_metrics_tests(context)
-            if metrics_tests:
-                suite.run(metrics_tests)
-
-        cleanup_tests = context.pop("cleanup_tests", [])
-        if cleanup_tests:
-            namespace_cleanups: List[HttpTest] = []
-            other_cleanups: List[HttpTest] = []
-            for test in cleanup_tests:
-                if "namespace" in test.name.lower():
-                    namespace_cleanups.append(test)
-                else:
-                    other_cleanups.append(test)
-            cleanup_tests = other_cleanups + namespace_cleanups
-            suite.run(cleanup_tests)
-
-    summary = suite.summarize()
-    mgmt_count = len(management_tests)
-    catalog_count = len(catalog_tests)
-    mgmt_write_count = len(management_write_tests)
-    write_count = len(catalog_write_tests)
-    view_count = len(view_write_tests)
-    metrics_count = len(metrics_tests)
-    cleanup_count = len(cleanup_tests)
-
-    mgmt_results = suite.results[:mgmt_count]
-    catalog_results = suite.results[mgmt_count : mgmt_count + catalog_count]
-    print_results("Management API", mgmt_results, args.verbose)
-    print_results("Catalog API", catalog_results, args.verbose)
-    cursor = mgmt_count + catalog_count
-    if management_write_tests:
-        mgmt_write_results = suite.results[cursor : cursor + mgmt_write_count]
-        print_results("Management Writes", mgmt_write_results, args.verbose)
-        cursor += mgmt_write_count
-    if catalog_write_tests:
-        write_results = suite.results[cursor : cursor + write_count]
-        print_results("Catalog Writes", write_results, args.verbose)
-        cursor += write_count
-    if view_write_tests:
-        view_results = suite.results[cursor : cursor + view_count]
-        print_results("View Writes", view_results, args.verbose)
-        cursor += view_count
-    if metrics_tests:
-        metrics_results = suite.results[cursor : cursor + metrics_count]
-        print_results("Table Metrics", metrics_results, args.verbose)
-        cursor += metrics_count
-    if cleanup_tests:
-        cleanup_results = suite.results[cursor : cursor + cleanup_count]
-        print_results("Cleanup", cleanup_results, args.verbose)
-    print(
-        f"\nExecuted {summary['total']} calls | Passed: {summary['passed']} | Expected: {summary['expected']} | Failed: {summary['failed']}"
-    )
-    return 0 if summary["failed"] == 0 else 1
+    tester = PolarisApiTester(account, scope, client_id, client_secret)
+    try:
+        suite = TestSuite(tester, context)
+        phase_results: List[Tuple[str, List[TestResult]]] = [
+            ("Management API", suite.run(build_management_tests(context))),
+            ("Catalog API", suite.run(build_catalog_tests(context))),
+        ]
+
+        if args.include_writes:
+            management_write_tests = build_management_write_tests(context)
+            if management_write_tests:
+                phase_results.append(("Management Writes", suite.run(management_write_tests)))
+
+            cleanup_tests: List[HttpTest] = []
+            catalog_write_tests, catalog_cleanups = build_catalog_write_tests(context)
+            cleanup_tests.extend(catalog_cleanups)
+            phase_results.append(("Catalog Writes", suite.run(catalog_write_tests)))
+
+            # View writes and metrics reporting only depend on the scratch namespace
+            # and table created above, not on each other, so they run side by side.
+            scratch_phases: List[Tuple[str, List[HttpTest]]] = []
+            if has_view_template:
+                view_write_tests, view_cleanups = build_view_write_tests(context)
+                cleanup_tests.extend(view_cleanups)
+                if view_write_tests:
+                    scratch_phases.append(("View Writes", view_write_tests))
+
+            if has_metrics_template:
+                metrics_tests = build_table_metrics_tests(context)
+                if metrics_tests:
+                    scratch_phases.append(("Table Metrics", metrics_tests))
+
+            if len(scratch_phases) > 1:
+                # Each phase captures into its own copy; merge back in phase order afterwards.
+                phase_contexts = [dict(context) for _ in scratch_phases]
+                with ThreadPoolExecutor(max_workers=len(scratch_phases)) as executor:
+                    futures = [
+                        executor.submit(suite.run, tests, phase_context)
+                        for (_, tests), phase_context in zip(scratch_phases, phase_contexts)
+                    ]
+                    phase_results.extend(
+                        (title, future.result()) for (title, _), future in zip(scratch_phases, futures)
+                    )
+                for phase_context in phase_contexts:
+                    context.update(phase_context)
+            else:
+                phase_results.extend((title, suite.run(tests)) for title, tests in scratch_phases)
+
+            if cleanup_tests:
+                phase_results.append(("Cleanup", suite.run_batches(_cleanup_batches(cleanup_tests))))
+
+        summary = suite.summarize()
+        lines: List[str] = []
+        for title, results in phase_results:
+            lines.extend(format_results(title, results, args.verbose))
+        lines.append("")
+        lines.append(
+            f"Executed {summary['total']} calls | Passed: {summary['passed']} | Expected: {summary['expected']} | Failed: {summary['failed']}"
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+        return 0 if summary["failed"] == 0 else 1
+    finally:
+        tester.close()
 
 
 if __name__ == "__main__":